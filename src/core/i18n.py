@@ -26,6 +26,8 @@ class I18n:
             cls._instance = super().__new__(cls)
             # Initialization is deferred to avoid early side effects (logs)
             cls._instance._initialized = False
+            # (language, key) -> resolved value; keys not found are cached as None
+            cls._instance._resolved = {}
         return cls._instance
 
     def _ensure_initialized(self):
@@ -51,6 +53,7 @@ class I18n:
             if os.path.exists(path):
                 with open(path, "r", encoding="utf-8") as f:
                     self._translations[lang] = json.load(f)
+                self._resolved.clear()
                 logger.debug(f"Loaded {lang} translations")
         except Exception as e:
             logger.error(f"Error loading {lang} translations: {e}")
@@ -91,6 +94,21 @@ class I18n:
     def available_languages(self) -> dict:
         return self._available_languages
 
+    def _resolve(self, key: str):
+        """Look up a dot-separated key in the current language, falling back to English."""
+        keys = key.split(".")
+        for lang in (self._current_lang, "en"):
+            value = self._translations.get(lang, {})
+            for k in keys:
+                if isinstance(value, dict):
+                    value = value.get(k)
+                else:
+                    value = None
+                    break
+            if value is not None:
+                return value
+        return None
+
     def t(self, key: str, default: Optional[str] = None, **kwargs) -> str:
         """
         Translate a key to the current language.
@@ -103,27 +121,11 @@ class I18n:
         Returns:
             Translated string, default value, or the key itself as fallback
         """
-        translations = self._translations.get(self._current_lang, {})
-
-        # Navigate through nested keys
-        keys = key.split(".")
-        value = translations
-        for k in keys:
-            if isinstance(value, dict):
-                value = value.get(k)
-            else:
-                value = None
-                break
-
-        if value is None:
-            # Fallback to English
-            value = self._translations.get("en", {})
-            for k in keys:
-                if isinstance(value, dict):
-                    value = value.get(k)
-                else:
-                    value = None
-                    break
+        cache_key = (self._current_lang, key)
+        try:
+            value = self._resolved[cache_key]
+        except KeyError:
+            value = self._resolved[cache_key] = self._resolve(key)
 
         if value is None:
             return default if default is not None else key  # Return default or key as fallback
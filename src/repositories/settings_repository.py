@@ -15,6 +15,8 @@ class SettingsRepository:
 
     def __init__(self, config_dir: str = None):
         self._config_dir = config_dir or os.path.dirname(RECENT_FILES_PATH)
+        # filename -> ((mtime_ns, size), value); revalidated with a stat on every read
+        self._cache: dict[str, tuple[tuple[int, int], str]] = {}
         self._ensure_config_dir()
         self._migrate_old_port()
 
@@ -34,19 +36,34 @@ class SettingsRepository:
                 pass
 
     def _read(self, filename: str, default: str = "") -> str:
-        """Read a setting file."""
+        """Read a setting file, reusing the cached value while the file is unchanged."""
         path = os.path.join(self._config_dir, filename)
-        if not os.path.exists(path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._cache.pop(filename, None)
             return default
+
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached = self._cache.get(filename)
+        if cached is not None and cached[0] == stamp:
+            return cached[1]
+
         try:
             with open(path, "r", encoding="utf-8") as f:
-                return f.read().strip()
+                value = f.read().strip()
         except Exception:
             return default
+        self._cache[filename] = (stamp, value)
+        return value
 
     def _write(self, filename: str, value: str) -> None:
-        """Write a setting file."""
+        """Write a setting file, skipping the write if the stored value is unchanged."""
+        if self._read(filename, None) == value:
+            return
         path = os.path.join(self._config_dir, filename)
+        # Coarse mtime resolution could hide our own rewrite, so drop the entry
+        self._cache.pop(filename, None)
         atomic_write(path, value)
 
     # --- Proxy Port ---
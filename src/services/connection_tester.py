@@ -107,9 +107,9 @@ class ConnectionTester:
         if socks_port:
             from src.utils.network_utils import NetworkUtils
 
-            start_time = time.time()
+            start_time = time.perf_counter()
             if NetworkUtils.check_proxy_connectivity(socks_port):
-                latency = int((time.time() - start_time) * 1000)
+                latency = int((time.perf_counter() - start_time) * 1000)
                 logger.info(f"[ConnectionTester] SOCKS proxy verified at 127.0.0.1:{socks_port} ({latency}ms)")
                 return (True, t("connection.latency_ms", value=latency), None)
 
@@ -138,6 +138,7 @@ class ConnectionTester:
             return False, t("connection.error"), None
 
         process = None
+        session = None
         try:
             cmd = [XRAY_EXECUTABLE, "run", "-c", config_path]
 
@@ -163,16 +164,18 @@ class ConnectionTester:
 
             target_url = "http://cp.cloudflare.com/"
 
-            # Retry logic for connection test
+            # Retry logic for connection test. One session for the retries and the
+            # geo lookup keeps the connection to the local inbound alive between them.
             max_retries = 3
+            session = requests.Session()
 
             for attempt in range(max_retries):
                 try:
-                    start_time = time.time()
-                    response = requests.get(target_url, proxies=proxies, timeout=CONNECT_TIMEOUT)
+                    start_time = time.perf_counter()
+                    response = session.get(target_url, proxies=proxies, timeout=CONNECT_TIMEOUT)
 
                     country_data = None
-                    latency = int((time.time() - start_time) * 1000)
+                    latency = int((time.perf_counter() - start_time) * 1000)
 
                     # ANY response through the proxy tunnel means the proxy is functional.
                     # Even 5xx errors indicate the connection through the proxy works.
@@ -182,7 +185,7 @@ class ConnectionTester:
                     # We got bytes back through the chain (Xray → proxy → internet).
                     if fetch_country and response.status_code < 300:
                         try:
-                            geo_resp = requests.get("http://ip-api.com/json", proxies=proxies, timeout=3)
+                            geo_resp = session.get("http://ip-api.com/json", proxies=proxies, timeout=3)
                             if geo_resp.status_code == 200:
                                 gdata = geo_resp.json()
                                 if gdata.get("status") == "success":
@@ -224,6 +227,8 @@ class ConnectionTester:
             return False, t("connection.error"), None
         finally:
             # 4. Cleanup
+            if session:
+                session.close()
             if process:
                 process.terminate()
                 try:
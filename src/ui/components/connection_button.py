@@ -1,5 +1,17 @@
+import asyncio
+
 import flet as ft
 
+# Glow pulse per state: (beat seconds, (opacity, scale) on the grow beat, (opacity, scale) on the rest beat)
+_PULSES = {
+    "connected": (1.2, (0.8, 1.02), (0.5, 1.0)),  # Slower, calmer breath for connected idle
+    "connecting": (0.8, (0.8, 1.04), (0.4, 1.0)),
+    "disconnecting": (0.4, (0.8, 1.04), (0.4, 1.0)),  # Faster pulse for disconnecting
+}
+
+# Activity glow colors in 1% opacity steps (finer than the 8-bit alpha they render to)
+_GLOW_COLORS = tuple(ft.Colors.with_opacity(i / 100, "#8b5cf6") for i in range(101))
+
 
 class ConnectionButton(ft.Container):
     """Connection button with animated glow based on network activity."""
@@ -11,6 +23,7 @@ class ConnectionButton(ft.Container):
         self._current_activity = 0
         self._last_active = False
         self._state = "disconnected"  # Track state: disconnected, connecting, connected
+        self._pulse_running = False
 
         # Outer glow layer - very tight, minimal space for glow
         self._glow_layer = ft.Container(
@@ -74,6 +87,13 @@ class ConnectionButton(ft.Container):
         except RuntimeError:
             pass
 
+    def _refresh(self):
+        """Update the button and glow, ignoring calls made while it is off the page."""
+        try:
+            self.update()
+        except RuntimeError:
+            pass
+
     def set_connected(self):
         """Set button to connected state with subtle purple glass glow."""
         self._is_connected = True
@@ -84,7 +104,6 @@ class ConnectionButton(ft.Container):
         self._button.bgcolor = ft.Colors.with_opacity(0.25, "#8b5cf6")
         self._button.border = ft.Border.all(2.5, ft.Colors.with_opacity(0.5, "#a78bfa"))
         self._icon.color = ft.Colors.WHITE
-        self._button.update()
 
         # Reset glow layer for network activity animation
         self._glow_layer.opacity = 1.0
@@ -97,42 +116,12 @@ class ConnectionButton(ft.Container):
             color=ft.Colors.with_opacity(0.7, "#8b5cf6"),
             offset=ft.Offset(0, 0),
         )
-        self._glow_layer.update()
+        # One update for button + glow instead of one message per layer
+        self._refresh()
 
         # Start a gentle idle breathing pulse for the connected state
         # This keeps the button "alive" even when waiting for first network stats
-        try:
-            _has_page = self.page is not None
-        except RuntimeError:
-            _has_page = False
-        if _has_page:
-            import asyncio
-
-            async def _connected_breath():
-                grow = True
-                while self._state == "connected":
-                    try:
-                        _ = self.page
-                    except RuntimeError:
-                        break
-                    try:
-                        # Only pulse if network activity is low (idle breath)
-                        # High activity will override with more dramatic expansion in update_network_activity
-                        if self._current_activity < 5:
-                            if grow:
-                                self._glow_layer.opacity = 0.8
-                                self._glow_layer.scale = 1.02
-                            else:
-                                self._glow_layer.opacity = 0.5
-                                self._glow_layer.scale = 1.0
-                            self._glow_layer.update()
-
-                        grow = not grow
-                        await asyncio.sleep(1.2)  # Slower, calmer breath for connected idle
-                    except Exception:
-                        break
-
-            self.page.run_task(_connected_breath)
+        self._start_pulse()
 
     def set_disconnected(self):
         """Set button to disconnected state."""
@@ -145,7 +134,6 @@ class ConnectionButton(ft.Container):
         self._button.bgcolor = ft.Colors.with_opacity(0.15, "#1e293b")
         self._button.border = ft.Border.all(1.5, ft.Colors.with_opacity(0.2, ft.Colors.WHITE))
         self._icon.color = ft.Colors.WHITE
-        self._button.update()
 
         # Minimal glow
         self._glow_layer.shadow = ft.BoxShadow(
@@ -154,7 +142,7 @@ class ConnectionButton(ft.Container):
             color=ft.Colors.with_opacity(0.2, ft.Colors.BLACK),
             offset=ft.Offset(0, 0),
         )
-        self._glow_layer.update()
+        self._refresh()
 
     def set_connecting(self):
         """Set connecting state with subtle amber glass pulse."""
@@ -166,7 +154,6 @@ class ConnectionButton(ft.Container):
         self._button.bgcolor = ft.Colors.with_opacity(0.25, "#f59e0b")
         self._button.border = ft.Border.all(2.5, ft.Colors.with_opacity(0.5, "#fbbf24"))
         self._icon.color = ft.Colors.WHITE
-        self._button.update()
 
         # Reset glow layer for smooth connecting animation
         self._glow_layer.opacity = 1.0
@@ -179,38 +166,9 @@ class ConnectionButton(ft.Container):
             color=ft.Colors.with_opacity(0.5, "#f59e0b"),  # Reduced from 0.8
             offset=ft.Offset(0, 0),
         )
-        self._glow_layer.update()
+        self._refresh()
 
-        # Start async pulse loop
-        try:
-            _has_page = self.page is not None
-        except RuntimeError:
-            _has_page = False
-        if _has_page:
-            import asyncio
-
-            async def _pulse_loop():
-                grow = True
-                while self._is_connecting:
-                    try:
-                        _ = self.page
-                    except RuntimeError:
-                        break
-                    try:
-                        if grow:
-                            self._glow_layer.opacity = 0.8
-                            self._glow_layer.scale = 1.04
-                        else:
-                            self._glow_layer.opacity = 0.4
-                            self._glow_layer.scale = 1.0
-
-                        self._glow_layer.update()
-                        grow = not grow
-                        await asyncio.sleep(0.8)
-                    except Exception:
-                        break
-
-            self.page.run_task(_pulse_loop)
+        self._start_pulse()
 
     def set_disconnecting(self):
         """Set disconnecting state with red glass pulse."""
@@ -222,7 +180,6 @@ class ConnectionButton(ft.Container):
         self._button.bgcolor = ft.Colors.with_opacity(0.25, ft.Colors.RED_700)
         self._button.border = ft.Border.all(2.5, ft.Colors.with_opacity(0.5, ft.Colors.RED_400))
         self._icon.color = ft.Colors.WHITE
-        self._button.update()
 
         # Reset glow layer for smooth animation
         self._glow_layer.opacity = 1.0
@@ -235,38 +192,48 @@ class ConnectionButton(ft.Container):
             color=ft.Colors.with_opacity(0.5, ft.Colors.RED_400),
             offset=ft.Offset(0, 0),
         )
-        self._glow_layer.update()
+        self._refresh()
+
+        self._start_pulse()
+
+    def _start_pulse(self):
+        """Start the glow pulse unless it is already running.
 
-        # Start async pulse loop
+        A single loop serves every pulsing state and picks up the new cadence
+        on its next beat, so quick state flips never stack extra loops.
+        """
+        if self._pulse_running:
+            return
         try:
-            _has_page = self.page is not None
+            page = self.page
         except RuntimeError:
-            _has_page = False
-        if _has_page:
-            import asyncio
+            page = None
+        if page is None:
+            return
+        self._pulse_running = True
+        page.run_task(self._pulse_loop)
 
-            async def _disconnecting_pulse():
-                grow = True
-                while self._state == "disconnecting":
-                    try:
-                        _ = self.page
-                    except RuntimeError:
-                        break
-                    try:
-                        if grow:
-                            self._glow_layer.opacity = 0.8
-                            self._glow_layer.scale = 1.04
-                        else:
-                            self._glow_layer.opacity = 0.4
-                            self._glow_layer.scale = 1.0
-
-                        self._glow_layer.update()
-                        grow = not grow
-                        await asyncio.sleep(0.4)  # Faster pulse for disconnecting
-                    except Exception:
-                        break
-
-            self.page.run_task(_disconnecting_pulse)
+    async def _pulse_loop(self):
+        grow = True
+        try:
+            while self._state in _PULSES:
+                try:
+                    _ = self.page
+                except RuntimeError:
+                    break
+                period, grow_beat, rest_beat = _PULSES[self._state]
+                # While connected, only pulse if network activity is low (idle breath)
+                # High activity will override with more dramatic expansion in update_network_activity
+                if self._state != "connected" or self._current_activity < 5:
+                    self._glow_layer.opacity, self._glow_layer.scale = grow_beat if grow else rest_beat
+                    self._glow_layer.update()
+
+                grow = not grow
+                await asyncio.sleep(period)
+        except Exception:
+            pass
+        finally:
+            self._pulse_running = False
 
     def update_network_activity(self, total_bps: float):
         """
@@ -318,13 +285,13 @@ class ConnectionButton(ft.Container):
         glow_opacity = 0.7 + (activity / 100) * 0.3  # 0.7 to 1.0
 
         try:
-            # Update shadow (instant) and animate scale/opacity (smooth)
-            self._glow_layer.shadow = ft.BoxShadow(
-                spread_radius=spread,
-                blur_radius=blur,
-                color=ft.Colors.with_opacity(opacity, "#8b5cf6"),
-                offset=ft.Offset(0, 0),
-            )
+            # Update shadow (instant) and animate scale/opacity (smooth).
+            # The shadow belongs to the glow layer alone, so it is mutated in place:
+            # the update then carries just the changed fields, not a new BoxShadow.
+            shadow = self._glow_layer.shadow
+            shadow.spread_radius = spread
+            shadow.blur_radius = blur
+            shadow.color = _GLOW_COLORS[round(opacity * 100)]
             self._glow_layer.scale = scale
             self._glow_layer.opacity = glow_opacity
             self._glow_layer.update()
@@ -6,14 +6,12 @@ from src.core.i18n import get_language, t
 from src.ui.log_viewer import LogViewer
 
 
+_PERSIAN_DIGITS = str.maketrans("0123456789", "۰۱۲۳۴۵۶۷۸۹")
+
+
 def to_persian_numerals(text: str) -> str:
     """Convert Latin numerals to Persian numerals."""
-    persian_digits = "۰۱۲۳۴۵۶۷۸۹"
-    latin_digits = "0123456789"
-    result = text
-    for latin, persian in zip(latin_digits, persian_digits):
-        result = result.replace(latin, persian)
-    return result
+    return text.translate(_PERSIAN_DIGITS)
 
 
 class LogsDrawer(ft.NavigationDrawer):
@@ -114,7 +112,7 @@ class LogsDrawer(ft.NavigationDrawer):
             self._pause_button.tooltip = t("logs.pause")
             self._pause_button.icon_color = ft.Colors.RED_600
 
-        e.control.page.update()
+        self._pause_button.update()
 
     def update_network_stats(self, download_speed: str, upload_speed: str):
         """Update network stats elements (Idempotent)."""
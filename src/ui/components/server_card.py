@@ -1,7 +1,29 @@
 import flet as ft
 
+from src.core.city_translator import translate_city
+from src.core.country_translator import translate_country
 from src.core.flag_colors import FLAG_COLORS
-from src.core.i18n import t
+from src.core.i18n import get_language, t
+from src.ui.helpers.gradient_helper import GradientHelper
+
+# (language, country code, country name, city) -> "Country, City" label
+_LOCATION_CACHE_MAX = 256
+_location_cache: dict[tuple, str] = {}
+
+
+def _location_label(country_code, country_name: str, city) -> str:
+    """Return the translated "Country, City" label, memoized per language."""
+    key = (get_language(), country_code, country_name, city)
+    label = _location_cache.get(key)
+    if label is None:
+        if country_code:
+            country_name = translate_country(country_code, country_name)
+        label = f"{country_name}, {translate_city(city)}" if city else country_name
+        if len(_location_cache) >= _LOCATION_CACHE_MAX:
+            # Drop the oldest entry (dicts keep insertion order)
+            del _location_cache[next(iter(_location_cache))]
+        _location_cache[key] = label
+    return label
 
 
 class ServerCard(ft.Container):
@@ -107,16 +129,11 @@ class ServerCard(ft.Container):
 
     def _update_gradient_colors(self):
         """Update gradient with current country colors."""
-        from src.ui.helpers.gradient_helper import GradientHelper
-
         cc = self._profile.get("country_code") if hasattr(self, "_profile") and self._profile else None
         self.gradient = GradientHelper.get_flag_gradient(cc)
 
     def update_server(self, profile):
         """Update server card with profile data."""
-        from src.core.city_translator import translate_city
-        from src.core.country_translator import translate_country
-
         self._profile = profile  # CRITICAL: Save profile so gradient helper can find it
         if not profile:
             self._icon_container.content = self._globe_icon
@@ -133,17 +150,20 @@ class ServerCard(ft.Container):
             # Update flag
             cc = profile.get("country_code")
             if cc:
-                new_image = ft.Image(
-                    src=f"/flags/{cc.lower()}.svg",
-                    width=36,
-                    height=36,
-                    fit=ft.BoxFit.COVER,
-                    gapless_playback=True,
-                    filter_quality=ft.FilterQuality.HIGH,
-                    border_radius=ft.BorderRadius.all(18),
-                    anti_alias=True,
-                )
-                self._icon_container.content = new_image
+                src = f"/flags/{cc.lower()}.svg"
+                current = self._icon_container.content
+                # Re-selecting the same country keeps the already-decoded image
+                if not (isinstance(current, ft.Image) and current.src == src):
+                    self._icon_container.content = ft.Image(
+                        src=src,
+                        width=36,
+                        height=36,
+                        fit=ft.BoxFit.COVER,
+                        gapless_playback=True,
+                        filter_quality=ft.FilterQuality.HIGH,
+                        border_radius=ft.BorderRadius.all(18),
+                        anti_alias=True,
+                    )
                 self._icon_container.tooltip = profile.get("country_name", cc)
                 self._current_colors = self._get_country_colors(cc)
             elif is_chain:
@@ -170,29 +190,15 @@ class ServerCard(ft.Container):
                 if exit_profile:
                     # Use exit profile for location display
                     country_name = exit_profile.get("country_name") or exit_profile.get("name", "")
-                    exit_cc = exit_profile.get("country_code")
-                    if exit_cc:
-                        country_name = translate_country(exit_cc, country_name)
-
-                    city = exit_profile.get("city")
-                    if city:
-                        translated_city = translate_city(city)
-                        self._country_city_text.value = f"{country_name}, {translated_city}"
-                    else:
-                        self._country_city_text.value = country_name
+                    self._country_city_text.value = _location_label(
+                        exit_profile.get("country_code"), country_name, exit_profile.get("city")
+                    )
                 else:
                     # Fallback to generic chain title
                     self._country_city_text.value = f"⛓ {t('chain.title')}"
             else:
                 country_name = profile.get("country_name") or profile.get("name", "")
-                if cc:
-                    country_name = translate_country(cc, country_name)
-                city = profile.get("city")
-                if city:
-                    translated_city = translate_city(city)
-                    self._country_city_text.value = f"{country_name}, {translated_city}"
-                else:
-                    self._country_city_text.value = country_name
+                self._country_city_text.value = _location_label(cc, country_name, profile.get("city"))
 
             self._name_text.value = profile["name"]
             self._name_text.color = ft.Colors.ON_SURFACE
@@ -9,8 +9,14 @@ import flet as ft
 from loguru import logger
 
 from src.core.i18n import t
+from src.ui.helpers.gradient_helper import GradientHelper
 from src.utils.link_parser import LinkParser
 
+# Layout values shared by every item in the list — treat as read-only
+_PAD_ITEM = ft.Padding.symmetric(horizontal=10, vertical=8)
+_PAD_FLAG = ft.Padding.only(left=5)
+_MARGIN_ITEM = ft.Margin.symmetric(horizontal=10)
+
 
 class ServerListItem(ft.Container):
     """A single server item in the server list with a simple popup menu."""
@@ -143,11 +149,9 @@ class ServerListItem(ft.Container):
         border_side = ft.BorderSide(2, ft.Colors.BLUE) if is_selected else ft.BorderSide(1, ft.Colors.OUTLINE)
 
         # Main Layout
-        from src.ui.helpers.gradient_helper import GradientHelper
-
         self.content = ft.Row(
             [
-                ft.Container(content=self.flag_img, padding=ft.Padding.only(left=5)),
+                ft.Container(content=self.flag_img, padding=_PAD_FLAG),
                 middle_content,
                 ft.Column(
                     [self.latency_text],
@@ -158,12 +162,12 @@ class ServerListItem(ft.Container):
             ],
             alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
         )
-        self.padding = ft.Padding.symmetric(horizontal=10, vertical=8)
+        self.padding = _PAD_ITEM
         self.bgcolor = "#121212"
         self.gradient = GradientHelper.get_flag_gradient(country_code)
         self.border = ft.Border.all(color=border_side.color, width=border_side.width)
         self.border_radius = 8
-        self.margin = ft.Margin.symmetric(horizontal=10)  # Added to reduce width
+        self.margin = _MARGIN_ITEM  # Added to reduce width
         self.on_click = lambda e: self._on_select(self._profile)
 
     def _get_ping_color(self, val):
@@ -217,24 +221,23 @@ class ServerListItem(ft.Container):
 
     def update_icon(self, code, name=""):
         if code:
-            # Update to flag image
-            self.flag_img.content = ft.Image(
-                src=f"/flags/{code.lower()}.svg",
-                width=28,
-                height=28,
-                fit=ft.BoxFit.COVER,
-                gapless_playback=True,
-                filter_quality=ft.FilterQuality.HIGH,
-                error_content=ft.Icon(ft.Icons.PUBLIC, size=28, color=ft.Colors.GREY_400),
-            )
-            from src.ui.helpers.gradient_helper import GradientHelper
-
+            # Update to flag image (keep the existing one if the flag is unchanged)
+            src = f"/flags/{code.lower()}.svg"
+            current = self.flag_img.content
+            if not (isinstance(current, ft.Image) and current.src == src):
+                self.flag_img.content = ft.Image(
+                    src=src,
+                    width=28,
+                    height=28,
+                    fit=ft.BoxFit.COVER,
+                    gapless_playback=True,
+                    filter_quality=ft.FilterQuality.HIGH,
+                    error_content=ft.Icon(ft.Icons.PUBLIC, size=28, color=ft.Colors.GREY_400),
+                )
             self.gradient = GradientHelper.get_flag_gradient(code)
         else:
             # Update to globe icon
             self.flag_img.content = ft.Icon(ft.Icons.PUBLIC, size=28, color=ft.Colors.GREY_400)
-            from src.ui.helpers.gradient_helper import GradientHelper
-
             self.gradient = GradientHelper.get_flag_gradient(None)
 
         self.flag_img.update()
@@ -55,6 +55,11 @@ class SettingsDrawer(ft.NavigationDrawer):
         # Mode state
         current_mode = self._get_current_mode()
         is_proxy = current_mode == ConnectionMode.PROXY
+        self._applied_mode = current_mode
+
+        # Elevation cannot change for the lifetime of this process; a restart
+        # as admin spawns a new process (and a new drawer).
+        self._is_admin = ProcessUtils.is_admin()
 
         # Components
         self._mode_switch_row = ModeSwitchRow(is_proxy, self._handle_mode_change)
@@ -288,13 +293,17 @@ class SettingsDrawer(ft.NavigationDrawer):
         """Handle VPN/Proxy mode switch."""
         is_proxy = bool(e.control.value) if (e and hasattr(e, "control") and e.control) else self._mode_switch_row.value
 
-        if not is_proxy and not ProcessUtils.is_admin():
+        if not is_proxy and not self._is_admin:
             self._mode_switch_row.value = True
             self._show_admin_restart_dialog()
             return
 
         new_mode = ConnectionMode.PROXY if is_proxy else ConnectionMode.VPN
+        if new_mode == self._applied_mode:
+            return
+
         self._on_mode_changed(new_mode)
+        self._applied_mode = new_mode
 
     def _show_admin_restart_dialog(self):
         """Show dialog to restart as admin for VPN mode."""
@@ -331,61 +340,56 @@ class SettingsDrawer(ft.NavigationDrawer):
         page.show_dialog(dlg)
 
     def _show_toast(self, message: str, message_type: str = "info"):
-        """Show a toast notification."""
+        """Show a toast notification (this also flushes pending page changes)."""
         if hasattr(self.page, "_toast_manager"):
             self.page._toast_manager.show(message, message_type)
         elif self.page:
-            # Log if toast manager is missing
+            # Log if toast manager is missing, but still flush pending changes
             logger.warning("Toast manager not available, message not shown")
+            self.page.update()
 
-    def _save_port(self, value: str):
-        """Save the SOCKS port setting."""
-        page = self.page
-        if not page:
-            return
+    def _save_port(self, value: str) -> bool:
+        """Save the SOCKS port setting; returns True if the port was stored."""
+        if not self.page:
+            return False
 
-        try:
-            port = int(value)
-            if 1024 <= port <= 65535:
-                self._app_context.settings.set_proxy_port(port)
-                self._port_row.set_border_color(ft.Colors.GREEN_400)
-                self._show_toast(t("settings.port_saved", port=port), "success")
-            else:
-                self._port_row.set_border_color(ft.Colors.RED_400)
-                self._show_toast(t("settings.port_invalid_range"), "error")
-        except ValueError:
+        value = (value or "").strip()
+        # isdecimal() rejects signs/exponents up front, so int() below cannot raise
+        if not value.isdecimal():
             self._port_row.set_border_color(ft.Colors.RED_400)
             self._show_toast(t("settings.port_must_be_number"), "error")
-
-        page.update()
+        elif 1024 <= (port := int(value)) <= 65535:
+            self._app_context.settings.set_proxy_port(port)
+            self._port_row.set_border_color(ft.Colors.GREEN_400)
+            self._show_toast(t("settings.port_saved", port=port), "success")
+            return True
+        else:
+            self._port_row.set_border_color(ft.Colors.RED_400)
+            self._show_toast(t("settings.port_invalid_range"), "error")
+        return False
 
     def _save_country(self, e):
         """Save the direct country setting."""
-        page = self.page
-        if not page:
+        if not self.page:
             return
 
         val = self._country_row.value
         self._app_context.settings.set_routing_country(val)
         self._show_toast(t("settings.country_saved", val=val), "success")
-        page.update()
 
     def _save_tun_engine(self, e):
         """Save the TUN implementation setting."""
-        page = self.page
-        if not page:
+        if not self.page:
             return
 
         val = self._tun_dropdown_row.value
         self._app_context.settings.set_tun_engine(val)
         display_name = "Xray TUN" if val == "xray" else "Sing-box TUN"
         self._show_toast(t("settings.tun_saved", val=display_name), "success")
-        page.update()
 
     def _save_language(self, e):
         """Save the language setting and update i18n."""
-        page = self.page
-        if not page:
+        if not self.page:
             return
 
         lang = self._language_row.value
@@ -395,17 +399,14 @@ class SettingsDrawer(ft.NavigationDrawer):
         # Notify user - app needs restart for full effect
         msg = t("settings.language_restart_msg")
         self._show_toast(msg, "success")
-        page.update()
 
     def _reset_close_preference(self, e):
         """Reset the 'Remember Choice' for close dialog."""
-        page = self.page
-        if not page:
+        if not self.page:
             return
 
         self._app_context.settings.set_remember_close_choice(False)
         self._show_toast(t("settings.reset_close_success"), "success")
-        page.update()
 
     def _on_installer_run(self, component: str):
         """Handle update/install request."""
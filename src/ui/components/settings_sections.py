@@ -2,11 +2,74 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Callable, Optional
 
 import flet as ft
 
-from src.core.i18n import t
+from src.core.i18n import get_language, t
+
+# Direct-routing countries: (code, flag emoji, translation key)
+_COUNTRIES = (
+    ("none", "", "countries.none"),
+    ("ir", "🇮🇷", "countries.ir"),
+    ("cn", "🇨🇳", "countries.cn"),
+    ("ru", "🇷🇺", "countries.ru"),
+)
+
+# UI languages: (language code, flag code, native name)
+_LANGUAGES = (
+    ("en", "gb", "English"),
+    ("fa", "ir", "فارسی"),
+    ("zh", "cn", "中文"),
+    ("ru", "ru", "Русский"),
+)
+_LANG_TO_FLAG = {lang_code: flag_code for lang_code, flag_code, _ in _LANGUAGES}
+_LANG_TO_FLAG_SRC = {lang_code: f"/flags/{flag_code}.svg" for lang_code, flag_code in _LANG_TO_FLAG.items()}
+
+# Shared layout values — treat as read-only, they are referenced by every row
+_PAD_ROW = ft.Padding.symmetric(horizontal=10, vertical=8)
+_PAD_ROW_TIGHT = ft.Padding.symmetric(horizontal=8, vertical=8)
+_TILE_SHAPE = ft.RoundedRectangleBorder(radius=8)
+_ROW_BG = ft.Colors.with_opacity(0.1, ft.Colors.ON_SURFACE)
+
+# Styling shared by every row's leading icon and main label
+_ICON_KW = {"color": ft.Colors.ON_SURFACE_VARIANT}
+_LABEL_KW = {"weight": ft.FontWeight.W_500}
+
+
+class LazyText(ft.Text):
+    """Text whose translation is resolved when it is first built on a page.
+
+    The settings drawer is constructed at startup but only mounted when opened,
+    so static labels defer their ``t()`` lookup until then.
+    """
+
+    def __init__(self, key: str, **kwargs):
+        super().__init__(**kwargs)
+        self._i18n_key = key
+
+    def build(self):
+        super().build()
+        if not self.value:
+            self.value = t(self._i18n_key)
+
+
+@lru_cache(maxsize=None)
+def _section_padding(horizontal: int) -> ft.Padding:
+    """Return the shared horizontal padding for a settings section."""
+    return ft.Padding.symmetric(horizontal=horizontal)
+
+
+@lru_cache(maxsize=8)
+def _country_labels(lang: str) -> tuple:
+    """Return ``(code, label)`` pairs for the country dropdown in ``lang``."""
+    return tuple((code, f"{flag} {t(key)}" if flag else t(key)) for code, flag, key in _COUNTRIES)
+
+
+def _country_options() -> list:
+    """Build country dropdown options (controls cannot be shared between dropdowns)."""
+    return [ft.dropdown.Option(code, label) for code, label in _country_labels(get_language())]
 
 
 class SettingsSection(ft.Container):
@@ -26,12 +89,17 @@ class SettingsSection(ft.Container):
                     *controls,
                 ]
             ),
-            padding=ft.Padding.symmetric(horizontal=padding_horizontal),
+            padding=_section_padding(padding_horizontal),
         )
 
 
 class SettingsRow(ft.Container):
-    """A row in a settings section with icon, label, and control."""
+    """A row in a settings section with icon, label, and control.
+
+    The row content is assembled the first time ``build()`` runs, i.e. when the
+    row is first mounted, not when the (eagerly created) settings drawer is
+    constructed. Later re-adds, such as reopening the drawer, reuse it.
+    """
 
     def __init__(
         self,
@@ -41,9 +109,22 @@ class SettingsRow(ft.Container):
         sublabel: Optional[str] = None,
         sublabel_control: Optional[ft.Control] = None,
     ):
+        super().__init__(
+            padding=10,
+            border_radius=8,
+            bgcolor=_ROW_BG,
+        )
+        self._row_spec = (icon, label, control, sublabel, sublabel_control)
+
+    def build(self):
+        super().build()
+        if self.content is not None:
+            return
+        icon, label, control, sublabel, sublabel_control = self._row_spec
+
         label_column = ft.Column(
             [
-                ft.Text(label, weight=ft.FontWeight.W_500),
+                ft.Text(label, **_LABEL_KW),
             ],
             spacing=2,
             expand=True,
@@ -55,23 +136,18 @@ class SettingsRow(ft.Container):
         elif sublabel:
             label_column.controls.append(ft.Text(sublabel, size=11, color=ft.Colors.ON_SURFACE_VARIANT))
 
-        super().__init__(
-            content=ft.Row(
-                [
-                    ft.Icon(icon, color=ft.Colors.ON_SURFACE_VARIANT),
-                    label_column,
-                    control,
-                ],
-                alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
-            ),
-            padding=10,
-            border_radius=8,
-            bgcolor=ft.Colors.with_opacity(0.1, ft.Colors.ON_SURFACE),
+        self.content = ft.Row(
+            [
+                ft.Icon(icon, **_ICON_KW),
+                label_column,
+                control,
+            ],
+            alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
         )
 
 
 class SettingsListTile(ft.ListTile):
-    """A styled list tile for settings navigation."""
+    """A styled list tile for settings navigation (children built on first mount)."""
 
     def __init__(
         self,
@@ -81,16 +157,23 @@ class SettingsListTile(ft.ListTile):
         on_click: Optional[Callable] = None,
         show_chevron: bool = True,
     ):
-        trailing = ft.Icon(ft.Icons.CHEVRON_RIGHT, size=18, color=ft.Colors.OUTLINE) if show_chevron else None
-
         super().__init__(
-            leading=ft.Icon(icon, color=ft.Colors.ON_SURFACE_VARIANT),
-            title=ft.Text(title, weight=ft.FontWeight.W_500),
-            subtitle=ft.Text(subtitle, size=12),
-            trailing=trailing,
             on_click=on_click,
-            shape=ft.RoundedRectangleBorder(radius=8),
+            shape=_TILE_SHAPE,
         )
+        self._tile_spec = (icon, title, subtitle, show_chevron)
+
+    def build(self):
+        super().build()
+        if self.title is not None:
+            return
+        icon, title, subtitle, show_chevron = self._tile_spec
+
+        self.leading = ft.Icon(icon, **_ICON_KW)
+        self.title = ft.Text(title, **_LABEL_KW)
+        self.subtitle = ft.Text(subtitle, size=12)
+        if show_chevron:
+            self.trailing = ft.Icon(ft.Icons.CHEVRON_RIGHT, size=18, color=ft.Colors.OUTLINE)
 
 
 class ModeSwitchRow(ft.Container):
@@ -119,15 +202,15 @@ class ModeSwitchRow(ft.Container):
         super().__init__(
             content=ft.Row(
                 [
-                    ft.Icon(ft.Icons.VPN_LOCK, color=ft.Colors.ON_SURFACE_VARIANT),
+                    ft.Icon(ft.Icons.VPN_LOCK, **_ICON_KW),
                     ft.Column(
                         [
-                            ft.Text(
-                                t("settings.connection_mode"),
-                                weight=ft.FontWeight.W_500,
+                            LazyText(
+                                "settings.connection_mode",
+                                **_LABEL_KW,
                             ),
-                            ft.Text(
-                                t("settings.mode_description"),
+                            LazyText(
+                                "settings.mode_description",
                                 size=11,
                                 color=ft.Colors.ON_SURFACE_VARIANT,
                             ),
@@ -148,7 +231,7 @@ class ModeSwitchRow(ft.Container):
             ),
             padding=10,
             border_radius=8,
-            bgcolor=ft.Colors.with_opacity(0.1, ft.Colors.ON_SURFACE),
+            bgcolor=_ROW_BG,
         )
 
     @property
@@ -170,9 +253,15 @@ class ModeSwitchRow(ft.Container):
 
 
 class PortInputRow(ft.Container):
-    """Port input row for settings."""
+    """Port input row for settings.
+
+    ``on_save`` receives the stripped field text and returns True once the
+    port has been stored; resubmitting that same value is then a no-op.
+    """
 
-    def __init__(self, initial_value: int, on_save: Callable):
+    def __init__(self, initial_value: int, on_save: Callable[[str], bool]):
+        self._on_save = on_save
+        self._last_saved = str(initial_value)
         self._field = ft.TextField(
             value=str(initial_value),
             width=100,
@@ -188,11 +277,11 @@ class PortInputRow(ft.Container):
         super().__init__(
             content=ft.Row(
                 [
-                    ft.Icon(ft.Icons.INPUT, size=24, color=ft.Colors.ON_SURFACE_VARIANT),
+                    ft.Icon(ft.Icons.INPUT, size=24, **_ICON_KW),
                     ft.Text(
                         t("settings.socks_port"),
                         size=12,
-                        weight=ft.FontWeight.W_500,
+                        **_LABEL_KW,
                         width=80,
                     ),
                     self._field,
@@ -201,23 +290,34 @@ class PortInputRow(ft.Container):
                         icon_size=20,
                         icon_color=ft.Colors.PRIMARY,
                         tooltip=t("settings.save"),
-                        on_click=lambda e: on_save(self._field.value),
+                        on_click=self._submit,
                     ),
                 ],
                 spacing=5,
                 alignment=ft.MainAxisAlignment.START,
                 vertical_alignment=ft.CrossAxisAlignment.CENTER,
             ),
-            padding=ft.Padding.symmetric(horizontal=10, vertical=8),
+            padding=_PAD_ROW,
         )
 
     @property
     def value(self) -> str:
         return self._field.value
 
+    def _submit(self, e):
+        value = (self._field.value or "").strip()
+        if value == self._last_saved:
+            # Nothing to store; just clear any error highlight left from a bad entry
+            if self._field.border_color == ft.Colors.RED_400:
+                self._field.border_color = ft.Colors.OUTLINE_VARIANT
+                self._field.update()
+            return
+        if self._on_save(value):
+            self._last_saved = value
+
     def set_border_color(self, color):
+        """Set the field border color; the caller is responsible for the update."""
         self._field.border_color = color
-        self._field.update()
 
 
 class CountryDropdownRow(ft.Container):
@@ -229,12 +329,7 @@ class CountryDropdownRow(ft.Container):
             text_size=12,
             content_padding=8,
             value=current_value if current_value else "none",
-            options=[
-                ft.dropdown.Option("none", t("countries.none")),
-                ft.dropdown.Option("ir", "🇮🇷 " + t("countries.ir")),
-                ft.dropdown.Option("cn", "🇨🇳 " + t("countries.cn")),
-                ft.dropdown.Option("ru", "🇷🇺 " + t("countries.ru")),
-            ],
+            options=_country_options(),
             border_color=ft.Colors.OUTLINE_VARIANT,
             focused_border_color=ft.Colors.PRIMARY,
             on_select=on_change,
@@ -243,11 +338,11 @@ class CountryDropdownRow(ft.Container):
         super().__init__(
             content=ft.Row(
                 [
-                    ft.Icon(ft.Icons.PUBLIC, size=24, color=ft.Colors.ON_SURFACE_VARIANT),
+                    ft.Icon(ft.Icons.PUBLIC, size=24, **_ICON_KW),
                     ft.Text(
                         t("settings.direct_country"),
                         size=12,
-                        weight=ft.FontWeight.W_500,
+                        **_LABEL_KW,
                         width=80,
                     ),
                     self._dropdown,
@@ -256,7 +351,7 @@ class CountryDropdownRow(ft.Container):
                 alignment=ft.MainAxisAlignment.START,
                 vertical_alignment=ft.CrossAxisAlignment.CENTER,
             ),
-            padding=ft.Padding.symmetric(horizontal=8, vertical=8),
+            padding=_PAD_ROW_TIGHT,
         )
 
     @property
@@ -268,34 +363,18 @@ class LanguageDropdownRow(ft.Container):
     """Language dropdown row with flag images."""
 
     def __init__(self, current_value: str, on_change: Callable):
-        # Language options with flag codes
-        self._languages = [
-            ("en", "gb", "English"),
-            ("fa", "ir", "فارسی"),
-            ("zh", "cn", "中文"),
-            ("ru", "ru", "Русский"),
-        ]
-
         self._dropdown = ft.Dropdown(
             width=160,
             text_size=12,
             content_padding=8,
             value=current_value if current_value else "en",
-            options=[ft.dropdown.Option(lang_code, f"{name}") for lang_code, flag_code, name in self._languages],
+            options=[ft.dropdown.Option(lang_code, name) for lang_code, _, name in _LANGUAGES],
             border_color=ft.Colors.OUTLINE_VARIANT,
             focused_border_color=ft.Colors.PRIMARY,
-            on_select=on_change,
         )
 
-        # Get current flag code
-        current_flag = "gb"
-        for lang_code, flag_code, name in self._languages:
-            if lang_code == (current_value or "en"):
-                current_flag = flag_code
-                break
-
         self._flag_image = ft.Image(
-            src=f"/flags/{current_flag}.svg",
+            src=_LANG_TO_FLAG_SRC.get(current_value or "en", _LANG_TO_FLAG_SRC["en"]),
             width=24,
             height=18,
             fit=ft.BoxFit.COVER,
@@ -308,15 +387,13 @@ class LanguageDropdownRow(ft.Container):
         original_on_change = on_change
 
         def wrapped_on_change(e):
-            selected = self._dropdown.value
-            for lang_code, flag_code, _ in self._languages:
-                if lang_code == selected:
-                    self._flag_image.src = f"/flags/{flag_code}.svg"
-                    self._flag_image.update()
-                    break
+            flag_src = _LANG_TO_FLAG_SRC.get(self._dropdown.value)
+            if flag_src and flag_src != self._flag_image.src:
+                self._flag_image.src = flag_src
+                self._flag_image.update()
             original_on_change(e)
 
-        self._dropdown.on_change = wrapped_on_change
+        self._dropdown.on_select = wrapped_on_change
 
         super().__init__(
             content=ft.Row(
@@ -330,7 +407,7 @@ class LanguageDropdownRow(ft.Container):
                             ft.Text(
                                 t("settings.language"),
                                 size=11,
-                                weight=ft.FontWeight.W_500,
+                                **_LABEL_KW,
                                 text_align=ft.TextAlign.CENTER,
                             ),
                         ],
@@ -344,7 +421,7 @@ class LanguageDropdownRow(ft.Container):
                 alignment=ft.MainAxisAlignment.START,
                 vertical_alignment=ft.CrossAxisAlignment.CENTER,
             ),
-            padding=ft.Padding.symmetric(horizontal=10, vertical=8),
+            padding=_PAD_ROW,
         )
 
     @property
@@ -383,6 +460,7 @@ class StartupToggleRow(ft.Container):
         self._on_register = on_register
         self._on_unregister = on_unregister
         self._toast_callback = toast_callback
+        self._is_registered = is_registered
 
         self._switch = ft.Switch(
             value=is_registered,
@@ -391,8 +469,8 @@ class StartupToggleRow(ft.Container):
             disabled=not is_supported,
         )
 
-        self._sublabel = ft.Text(
-            t("settings.add_to_startup_desc"),
+        self._sublabel = LazyText(
+            "settings.add_to_startup_desc",
             size=11,
             color=ft.Colors.ON_SURFACE_VARIANT,
         )
@@ -400,10 +478,10 @@ class StartupToggleRow(ft.Container):
         super().__init__(
             content=ft.Row(
                 [
-                    ft.Icon(ft.Icons.ROCKET_LAUNCH, color=ft.Colors.ON_SURFACE_VARIANT),
+                    ft.Icon(ft.Icons.ROCKET_LAUNCH, **_ICON_KW),
                     ft.Column(
                         [
-                            ft.Text(t("settings.add_to_startup"), weight=ft.FontWeight.W_500),
+                            LazyText("settings.add_to_startup", **_LABEL_KW),
                             self._sublabel,
                         ],
                         spacing=2,
@@ -415,12 +493,14 @@ class StartupToggleRow(ft.Container):
             ),
             padding=10,
             border_radius=8,
-            bgcolor=ft.Colors.with_opacity(0.1, ft.Colors.ON_SURFACE),
+            bgcolor=_ROW_BG,
         )
 
     def _handle_toggle(self, e):
         """Handle toggle change - coordinates registration and UI update."""
         enabled = self._switch.value
+        if enabled == self._is_registered:
+            return
 
         if enabled:
             success, _ = self._on_register()
@@ -428,12 +508,12 @@ class StartupToggleRow(ft.Container):
             success, _ = self._on_unregister()
 
         if success:
+            self._is_registered = enabled
             self._app_context.settings.set_startup_enabled(enabled)
             self._toast_callback(t("settings.startup_saved"), "success")
         else:
-            # Revert on failure
+            # Revert on failure (flushed by the page update below)
             self._switch.value = not enabled
-            self._switch.update()
             self._toast_callback(t("settings.startup_error"), "error")
 
         if self.page:
@@ -464,21 +544,22 @@ class AutoReconnectToggleRow(ft.Container):
         self._toast_callback = toast_callback
 
         is_enabled = app_context.settings.get_auto_reconnect_enabled()
+        self._is_enabled = is_enabled
         self._switch = ft.Switch(
             value=is_enabled,
             active_color=ft.Colors.PRIMARY,
             on_change=self._handle_toggle,
         )
 
-        self._sublabel = ft.Text(t("settings.experimental"), size=11, color=ft.Colors.ON_SURFACE_VARIANT)
+        self._sublabel = LazyText("settings.experimental", size=11, color=ft.Colors.ON_SURFACE_VARIANT)
 
         super().__init__(
             content=ft.Row(
                 [
-                    ft.Icon(ft.Icons.AUTORENEW, color=ft.Colors.ON_SURFACE_VARIANT),
+                    ft.Icon(ft.Icons.AUTORENEW, **_ICON_KW),
                     ft.Column(
                         [
-                            ft.Text(t("settings.auto_reconnect"), weight=ft.FontWeight.W_500),
+                            LazyText("settings.auto_reconnect", **_LABEL_KW),
                             self._sublabel,
                         ],
                         spacing=2,
@@ -490,12 +571,16 @@ class AutoReconnectToggleRow(ft.Container):
             ),
             padding=10,
             border_radius=8,
-            bgcolor=ft.Colors.with_opacity(0.1, ft.Colors.ON_SURFACE),
+            bgcolor=_ROW_BG,
         )
 
     def _handle_toggle(self, e):
         """Handle toggle change - coordinates persistence and UI update."""
         enabled = self._switch.value
+        if enabled == self._is_enabled:
+            return
+
+        self._is_enabled = enabled
         self._app_context.settings.set_auto_reconnect_enabled(enabled)
 
         if enabled:
@@ -535,13 +620,13 @@ class CipherSuitesInputRow(ft.Container):
                             ft.Icon(
                                 ft.Icons.SECURITY,
                                 size=24,
-                                color=ft.Colors.ON_SURFACE_VARIANT,
+                                **_ICON_KW,
                             ),
                             ft.Column(
                                 [
                                     ft.Text(
                                         t("settings.cipher_suites"),
-                                        weight=ft.FontWeight.W_500,
+                                        **_LABEL_KW,
                                     ),
                                     ft.Text(
                                         t("settings.cipher_suites_desc"),
@@ -574,7 +659,7 @@ class CipherSuitesInputRow(ft.Container):
                 ],
                 spacing=4,
             ),
-            padding=ft.Padding.symmetric(horizontal=10, vertical=8),
+            padding=_PAD_ROW,
         )
 
     @property
@@ -582,8 +667,8 @@ class CipherSuitesInputRow(ft.Container):
         return self._field.value
 
     def set_border_color(self, color):
+        """Set the field border color; the caller is responsible for the update."""
         self._field.border_color = color
-        self._field.update()
 
 
 class CoreDropdownRow(ft.Container):
@@ -607,13 +692,13 @@ class CoreDropdownRow(ft.Container):
         super().__init__(
             content=ft.Row(
                 [
-                    ft.Icon(ft.Icons.MEMORY, size=24, color=ft.Colors.ON_SURFACE_VARIANT),
+                    ft.Icon(ft.Icons.MEMORY, size=24, **_ICON_KW),
                     ft.Column(
                         [
                             ft.Text(
                                 t("settings.core_engine"),
                                 size=12,
-                                weight=ft.FontWeight.W_500,
+                                **_LABEL_KW,
                             ),
                             ft.Text(
                                 t("settings.core_engine_desc"),
@@ -630,9 +715,9 @@ class CoreDropdownRow(ft.Container):
                 alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
                 vertical_alignment=ft.CrossAxisAlignment.CENTER,
             ),
-            padding=ft.Padding.symmetric(horizontal=10, vertical=8),
+            padding=_PAD_ROW,
             border_radius=8,
-            bgcolor=ft.Colors.with_opacity(0.1, ft.Colors.ON_SURFACE),
+            bgcolor=_ROW_BG,
         )
 
     @property
@@ -661,13 +746,13 @@ class TunEngineDropdownRow(ft.Container):
         super().__init__(
             content=ft.Row(
                 [
-                    ft.Icon(ft.Icons.ROUTER, size=24, color=ft.Colors.ON_SURFACE_VARIANT),
+                    ft.Icon(ft.Icons.ROUTER, size=24, **_ICON_KW),
                     ft.Column(
                         [
                             ft.Text(
                                 t("settings.tun_engine"),
                                 size=12,
-                                weight=ft.FontWeight.W_500,
+                                **_LABEL_KW,
                             ),
                             ft.Text(
                                 t("settings.tun_engine_desc"),
@@ -684,9 +769,9 @@ class TunEngineDropdownRow(ft.Container):
                 alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
                 vertical_alignment=ft.CrossAxisAlignment.CENTER,
             ),
-            padding=ft.Padding.symmetric(horizontal=10, vertical=8),
+            padding=_PAD_ROW,
             border_radius=8,
-            bgcolor=ft.Colors.with_opacity(0.1, ft.Colors.ON_SURFACE),
+            bgcolor=_ROW_BG,
         )
 
     @property
@@ -719,12 +804,12 @@ class LanShareToggleRow(ft.Container):
         super().__init__(
             content=ft.Row(
                 [
-                    ft.Icon(ft.Icons.LAN, color=ft.Colors.ON_SURFACE_VARIANT),
+                    ft.Icon(ft.Icons.LAN, **_ICON_KW),
                     ft.Column(
                         [
-                            ft.Text(t("settings.allow_lan"), weight=ft.FontWeight.W_500),
-                            ft.Text(
-                                t("settings.allow_lan_desc"),
+                            LazyText("settings.allow_lan", **_LABEL_KW),
+                            LazyText(
+                                "settings.allow_lan_desc",
                                 size=11,
                                 color=ft.Colors.ON_SURFACE_VARIANT,
                             ),
@@ -738,7 +823,7 @@ class LanShareToggleRow(ft.Container):
             ),
             padding=10,
             border_radius=8,
-            bgcolor=ft.Colors.with_opacity(0.1, ft.Colors.ON_SURFACE),
+            bgcolor=_ROW_BG,
         )
 
     def _handle_toggle(self, e):
@@ -1,9 +1,13 @@
 """Status display component for showing connection status below button."""
 
+import re
+
 import flet as ft
 
 from src.core.i18n import t
 
+_HAS_DIGIT = re.compile(r"\d").search
+
 
 class StatusDisplay(ft.Container):
     """
@@ -56,11 +60,39 @@ class StatusDisplay(ft.Container):
             text_align=ft.TextAlign.CENTER,
         )
 
+    def _refresh(self):
+        """Sends pending changes; skipped while another view replaces the dashboard."""
+        try:
+            self.update()
+        except RuntimeError:
+            # Not mounted: the current label goes out with the dashboard when it is shown again
+            pass
+
+    def _is_showing(self, text: str, color: str) -> bool:
+        """Returns whether the label already shows this text in this color."""
+        return text == self._status_label.value and color == self._status_label.color
+
     def _update_label(self, text: str, color: str):
-        """Triggers a smooth transition to a new label."""
+        """Rewrites the current label in place (no transition).
+
+        Used for the frequent progress/ping messages, where a cross-fade per
+        message would only restart before the previous one has finished.
+        """
+        if self._is_showing(text, color):
+            return
+        self._status_label.value = text
+        self._status_label.color = color
+        self._refresh()
+
+    def _update_label_animated(self, text: str, color: str):
+        """Triggers a smooth transition to a new label (connection state changes)."""
+        if text == self._status_label.value:
+            # Same wording (at most a recolor): a new label would only replay the fade
+            self._update_label(text, color)
+            return
         self._status_label = self._create_label(text, color)
         self._switcher.content = self._status_label
-        self.update()
+        self._refresh()
 
     def set_step(self, msg: str):
         """Updates the status text during connection steps."""
@@ -71,30 +103,28 @@ class StatusDisplay(ft.Container):
         self._update_label(msg, ft.Colors.GREY_500)
 
     def set_initializing(self):
-        self._update_label(t("app.initializing"), ft.Colors.AMBER_400)
+        self._update_label_animated(t("app.initializing"), ft.Colors.AMBER_400)
 
     def set_connecting(self):
-        self._update_label(t("app.connecting"), ft.Colors.AMBER_400)
+        self._update_label_animated(t("app.connecting"), ft.Colors.AMBER_400)
 
     def set_connected(self, country_data: dict = None):
         """Sets status to Connected."""
         self._is_connected = True
-        self._update_label(t("app.connected"), "#7c3aed")  # Purple
+        self._update_label_animated(t("app.connected"), "#7c3aed")  # Purple
 
     def set_disconnected(self):
         """Reset to disconnected state."""
         self._is_connected = False
-        self._update_label(t("app.disconnected"), ft.Colors.ORANGE_400)
+        self._update_label_animated(t("app.disconnected"), ft.Colors.ORANGE_400)
 
     def set_disconnecting(self):
         """Show disconnecting state."""
         self._is_connected = False
-        self._update_label(t("app.disconnecting"), ft.Colors.RED_400)
+        self._update_label_animated(t("app.disconnecting"), ft.Colors.RED_400)
 
     def set_pre_connection_ping(self, latency_text: str, is_success: bool):
         """Updates the status text with latency."""
-        import re
-
         status_text = ""
         status_color = ft.Colors.GREY_500
 
@@ -102,7 +132,7 @@ class StatusDisplay(ft.Container):
             status_text = t("app.checking")
             status_color = ft.Colors.GREY_500
         else:
-            has_number = bool(re.search(r"\d+", latency_text))
+            has_number = _HAS_DIGIT(latency_text) is not None
             prefix = f"{t('connection.ping_prefix')} " if is_success and has_number else ""
             status_text = f"{prefix}{latency_text}"
 
@@ -7,6 +7,15 @@ from typing import Callable
 import flet as ft
 
 from src.core.i18n import t
+from src.ui.helpers.gradient_helper import GradientHelper
+
+# Layout values shared by every subscription row — treat as read-only
+_PAD_ITEM = ft.Padding.symmetric(horizontal=10, vertical=8)
+_PAD_ICON = ft.Padding.only(left=5, right=10)
+_MARGIN_ITEM = ft.Margin.symmetric(horizontal=10)
+_BORDER_COLOR = ft.Colors.OUTLINE_VARIANT if hasattr(ft.Colors, "OUTLINE_VARIANT") else ft.Colors.OUTLINE
+_BORDER_ITEM = ft.Border.all(1, _BORDER_COLOR)
+_GRADIENT_ITEM = GradientHelper.get_flag_gradient(None)  # Default gradient
 
 
 class SubscriptionListItem(ft.Container):
@@ -50,7 +59,7 @@ class SubscriptionListItem(ft.Container):
             [
                 ft.Container(
                     content=ft.Icon(ft.Icons.FOLDER_OPEN_ROUNDED, color=ft.Colors.BLUE_400, size=24),
-                    padding=ft.Padding.only(left=5, right=10),
+                    padding=_PAD_ICON,
                 ),
                 ft.Column(
                     [
@@ -78,19 +87,13 @@ class SubscriptionListItem(ft.Container):
             alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
         )
 
-        from src.ui.helpers.gradient_helper import GradientHelper
-
         self.content = foreground_content
         self.bgcolor = "#121212"
-        self.gradient = GradientHelper.get_flag_gradient(None)  # Default gradient
-        self.border = (
-            ft.Border.all(1, ft.Colors.OUTLINE_VARIANT)
-            if hasattr(ft.Colors, "OUTLINE_VARIANT")
-            else ft.Border.all(1, ft.Colors.OUTLINE)
-        )
+        self.gradient = _GRADIENT_ITEM
+        self.border = _BORDER_ITEM
         self.border_radius = 8
-        self.margin = ft.Margin.symmetric(horizontal=10)  # Added to reduce width
-        self.padding = ft.Padding.symmetric(horizontal=10, vertical=8)
+        self.margin = _MARGIN_ITEM  # Added to reduce width
+        self.padding = _PAD_ITEM
         self.on_click = lambda e: self._on_click(self._sub)
 
     def _copy_link(self, e):
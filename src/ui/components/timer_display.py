@@ -1,21 +1,21 @@
 """Timer display component for showing connection time at top of page."""
 
-import threading
+import asyncio
 import time
+from concurrent.futures import Future
+from typing import Optional
 
 import flet as ft
 
 from src.core.i18n import get_language, t
 
 
+_PERSIAN_DIGITS = str.maketrans("0123456789", "۰۱۲۳۴۵۶۷۸۹")
+
+
 def to_persian_numerals(text: str) -> str:
     """Convert Latin numerals to Persian numerals."""
-    persian_digits = "۰۱۲۳۴۵۶۷۸۹"
-    latin_digits = "0123456789"
-    result = text
-    for latin, persian in zip(latin_digits, persian_digits):
-        result = result.replace(latin, persian)
-    return result
+    return text.translate(_PERSIAN_DIGITS)
 
 
 class TimerDisplay(ft.Container):
@@ -28,9 +28,10 @@ class TimerDisplay(ft.Container):
         super().__init__()
 
         self._is_connected = False
-        self._timer_running = False
+        self._timer_task: Optional[Future] = None
         self._start_time = 0
-        self._timer_thread = None
+        # Looked up once per connection rather than on every tick
+        self._persian_digits = get_language() == "fa"
 
         # Main timer text with fixed width for monospace-like display
         self._timer_text = ft.Text(
@@ -49,16 +50,19 @@ class TimerDisplay(ft.Container):
             width=200,  # Fixed width to prevent shifting
         )
 
-    def _format_timer(self, hours: int, minutes: int, seconds: int) -> str:
-        """Format timer with appropriate numerals based on language."""
+    def _format_timer(self, elapsed: int) -> str:
+        """Format elapsed seconds as HH:MM:SS with numerals for the current language."""
+        minutes, seconds = divmod(elapsed, 60)
+        hours, minutes = divmod(minutes, 60)
         timer_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-        if get_language() == "fa":
+        if self._persian_digits:
             return to_persian_numerals(timer_str)
         return timer_str
 
     def set_connecting(self):
         """Show connecting state - show 00:00:00 immediately."""
-        self._timer_text.value = self._format_timer(0, 0, 0)
+        self._persian_digits = get_language() == "fa"
+        self._timer_text.value = self._format_timer(0)
         self._timer_text.color = "#d97706"  # Amber that works in both modes
         self._timer_text.size = 28
         self._timer_text.weight = ft.FontWeight.BOLD
@@ -74,29 +78,61 @@ class TimerDisplay(ft.Container):
         self.update()
 
     def _start_timer(self):
-        """Start the connection timer."""
-        self._timer_running = True
-        self._start_time = time.time()
-
-        def timer_loop():
-            while self._timer_running and self._is_connected:
-                elapsed = int(time.time() - self._start_time)
-                hours = elapsed // 3600
-                minutes = (elapsed % 3600) // 60
-                seconds = elapsed % 60
-                self._timer_text.value = self._format_timer(hours, minutes, seconds)
+        """Start the connection timer on the page's event loop."""
+        # Cancel any previous run first, so a quick disconnect/reconnect
+        # can never leave the old loop ticking alongside the new one
+        self._stop_timer()
+        self._start_time = time.monotonic()
+        self._persian_digits = get_language() == "fa"
+        self._run_timer()
+
+    def _run_timer(self):
+        """Schedule the tick loop; without a page, did_mount schedules it later."""
+        try:
+            page = self.page
+        except RuntimeError:
+            return
+        if page is not None:
+            self._timer_task = page.run_task(self._timer_loop)
+
+    def did_mount(self):
+        super().did_mount()
+        # Resume ticking (from the original start time) after being off screen
+        if self._is_connected:
+            self._stop_timer()
+            self._run_timer()
+
+    def will_unmount(self):
+        super().will_unmount()
+        # Nothing to show while unmounted; stop the loop instead of letting it fail
+        self._stop_timer()
+
+    async def _timer_loop(self):
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        while True:
+            text = self._format_timer(int(time.monotonic() - self._start_time))
+            # A tick that lands within the same second has nothing new to send
+            if text != self._timer_text.value:
+                self._timer_text.value = text
                 try:
                     self.update()
                 except Exception:
                     break
-                time.sleep(1)
-
-        self._timer_thread = threading.Thread(target=timer_loop, daemon=True)
-        self._timer_thread.start()
+            # Tick on a fixed one-second cadence (loop clock is monotonic), so the
+            # cost of formatting and updating is absorbed instead of drifting
+            deadline += 1
+            now = loop.time()
+            if deadline <= now:
+                # Fell behind (event loop was busy); resync
+                deadline = now + 1
+            await asyncio.sleep(deadline - now)
 
     def _stop_timer(self):
-        """Stop the connection timer."""
-        self._timer_running = False
+        """Stop the connection timer; cancellation interrupts its sleep."""
+        if self._timer_task is not None:
+            self._timer_task.cancel()
+            self._timer_task = None
 
     def set_disconnected(self):
         """Reset to disconnected state."""
@@ -2,9 +2,37 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
 
 import flet as ft
 
+# Toasts share one position, so only the newest few are kept on screen
+_MAX_TOASTS = 3
+
+_ICONS = {
+    "info": ft.Icons.INFO_ROUNDED,
+    "success": ft.Icons.CHECK_CIRCLE_ROUNDED,
+    "error": ft.Icons.ERROR_ROUNDED,
+    "warning": ft.Icons.WARNING_ROUNDED,
+}
+# Shared by every toast and never mutated
+_TOAST_PADDING = ft.Padding.symmetric(horizontal=16, vertical=10)
+_TOAST_SHADOW = ft.BoxShadow(
+    spread_radius=0,
+    blur_radius=8,
+    color=ft.Colors.with_opacity(0.2, ft.Colors.BLACK),
+    offset=ft.Offset(0, 2),
+)
+
+
+def _remove_item(items, item) -> bool:
+    """Remove ``item`` by identity; Flet controls compare equal by field values."""
+    for i, other in enumerate(items):
+        if other is item:
+            del items[i]
+            return True
+    return False
+
 
 class Toast(ft.Container):
     """A glassy toast notification that appears at the top center of the screen."""
@@ -15,15 +43,7 @@ class Toast(ft.Container):
         message_type: str = "info",  # "info", "success", "error", "warning"
         duration: int = 3000,  # milliseconds
     ):
-        # Icon map
-        icon_map = {
-            "info": ft.Icons.INFO_ROUNDED,
-            "success": ft.Icons.CHECK_CIRCLE_ROUNDED,
-            "error": ft.Icons.ERROR_ROUNDED,
-            "warning": ft.Icons.WARNING_ROUNDED,
-        }
-
-        icon = icon_map.get(message_type, ft.Icons.INFO_ROUNDED)
+        icon = _ICONS.get(message_type, ft.Icons.INFO_ROUNDED)
 
         super().__init__(
             content=ft.Row(
@@ -42,13 +62,8 @@ class Toast(ft.Container):
             bgcolor=ft.Colors.with_opacity(0.08, ft.Colors.SURFACE),  # More transparent
             blur=30,  # More blur
             border_radius=10,
-            padding=ft.Padding.symmetric(horizontal=16, vertical=10),
-            shadow=ft.BoxShadow(
-                spread_radius=0,
-                blur_radius=8,
-                color=ft.Colors.with_opacity(0.2, ft.Colors.BLACK),
-                offset=ft.Offset(0, 2),
-            ),
+            padding=_TOAST_PADDING,
+            shadow=_TOAST_SHADOW,
             animate_opacity=300,
             opacity=1,
         )
@@ -61,6 +76,7 @@ class ToastManager:
 
     def __init__(self, page: ft.Page):
         self._page = page
+        self._active: deque[ft.Container] = deque()
 
     def show(
         self,
@@ -80,7 +96,13 @@ class ToastManager:
             alignment=ft.Alignment.TOP_CENTER,
         )
 
+        # Under a burst of toasts, drop the oldest ones in the same page update
+        # that adds the new toast
+        while len(self._active) >= _MAX_TOASTS:
+            self._discard(self._active.popleft())
+
         # Add to overlay
+        self._active.append(toast_container)
         self._page.overlay.append(toast_container)
         self._page.update()
 
@@ -88,31 +110,33 @@ class ToastManager:
         async def auto_dismiss():
             try:
                 await asyncio.sleep(duration / 1000)
+                if not any(c is toast_container for c in self._active):
+                    return  # Already dropped by a newer toast
 
-                # Fade out
+                # Fade out (only the toast itself needs to be sent)
                 toast.opacity = 0
-                self._page.update()
+                toast.update()
 
                 # Wait for fade animation
                 await asyncio.sleep(0.3)
-
-                # Remove from overlay
-                if toast_container in self._page.overlay:
-                    self._page.overlay.remove(toast_container)
+            except Exception:
+                pass
+            # Remove from overlay (also the cleanup path on error)
+            try:
+                if _remove_item(self._active, toast_container):
+                    self._discard(toast_container)
                     self._page.update()
             except Exception:
-                # Cleanup on error
-                try:
-                    if toast_container in self._page.overlay:
-                        self._page.overlay.remove(toast_container)
-                        self._page.update()
-                except Exception:
-                    # Ignore errors during cleanup
-                    pass
+                # Ignore errors during cleanup
+                pass
 
         # Use page.run_task for proper async execution
         self._page.run_task(auto_dismiss)
 
+    def _discard(self, toast_container: ft.Container):
+        """Take a toast off the overlay; the caller sends the page update."""
+        _remove_item(self._page.overlay, toast_container)
+
     def info(self, message: str, duration: int = 3000):
         """Show an info toast."""
         self.show(message, "info", duration)
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 import json
 import os
+import queue
 import threading
 import time
+from concurrent.futures import Future
 from typing import Callable, Optional
 
 from src.core.app_context import AppContext
@@ -14,7 +16,11 @@ from src.core.constants import TMPDIR, XRAY_LOG_FILE
 from src.core.i18n import t
 from src.core.logger import logger
 from src.core.types import ConnectionMode
+from src.repositories.file_utils import atomic_write
 from src.services.network_stats import NetworkStatsService
+from src.utils.network_utils import NetworkUtils
+
+_MIN_DISCONNECTING_SECONDS = 1.0
 
 
 class ConnectionHandler:
@@ -37,6 +43,12 @@ class ConnectionHandler:
         self._app_context = app_context
         self._network_stats = network_stats
         self._state_lock = threading.Lock()  # Thread safety for shared state
+        # Connect/reconnect/disconnect tasks run one at a time, in click order, so
+        # a connect started during a disconnect's teardown waits for it to finish.
+        # The worker is a daemon thread so a task still running cannot hold up exit
+        self._tasks: queue.Queue = queue.Queue()
+        self._pending: Optional[Future] = None
+        threading.Thread(target=self._task_worker, daemon=True, name="ConnectionHandler-Tasks").start()
 
         # UI components (set via setup)
         self._ui_helper = None
@@ -104,13 +116,13 @@ class ConnectionHandler:
     # -------------------------------------------------------------------------
 
     def connect_async(self):
-        """Start connection in background thread."""
+        """Start connection on the background task worker."""
         if self._is_connecting():
             return
 
         self._set_connecting(True)
         self._show_connecting_ui()
-        threading.Thread(target=self._perform_connect_task, daemon=True).start()
+        self._submit(self._perform_connect_task)
 
     def reconnect(self):
         """Fast reconnect for server switching while already connected."""
@@ -119,7 +131,7 @@ class ConnectionHandler:
 
         self._set_connecting(True)
         self._show_connecting_ui()
-        threading.Thread(target=self._fast_reconnect_task, daemon=True).start()
+        self._submit(self._fast_reconnect_task)
 
     def disconnect(self):
         """Disconnect from VPN/Proxy."""
@@ -127,8 +139,37 @@ class ConnectionHandler:
         if not is_running:
             return
 
+        # A connect/reconnect still queued behind another task is superseded
+        pending = self._pending
+        if pending is not None and pending.cancel():
+            self._set_connecting(False)
+
         self._show_disconnecting_ui()
-        threading.Thread(target=self._disconnect_task, daemon=True).start()
+        self._submit(self._disconnect_task)
+
+    # -------------------------------------------------------------------------
+    # Background Task Worker
+    # -------------------------------------------------------------------------
+
+    def _submit(self, task: Callable[[], None]) -> Future:
+        """Queue a task for the worker and track it as the pending one."""
+        future: Future = Future()
+        self._pending = future
+        self._tasks.put((future, task))
+        return future
+
+    def _task_worker(self):
+        """Run queued tasks one at a time, skipping any that were cancelled."""
+        while True:
+            future, task = self._tasks.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                task()
+                future.set_result(None)
+            except Exception as e:
+                logger.error(f"[ConnectionHandler] Background task failed: {e}")
+                future.set_exception(e)
 
     # -------------------------------------------------------------------------
     # Thread-safe State Management
@@ -164,32 +205,47 @@ class ConnectionHandler:
         if self._ui_helper and callback:
             self._ui_helper.call(callback)
 
+    # Each state transition is marshalled to the UI loop as one callback
+    # instead of one page task per widget
+
     def _show_connecting_ui(self):
         """Show connecting state in UI."""
-        if self._connection_button:
-            self._ui_call(self._connection_button.set_connecting)
-        if self._status_display:
-            self._ui_call(self._status_display.set_initializing)
-        if self._update_horizon_glow_callback:
-            self._ui_call(lambda: self._update_horizon_glow_callback("connecting"))
+
+        def apply():
+            if self._connection_button:
+                self._connection_button.set_connecting()
+            if self._status_display:
+                self._status_display.set_initializing()
+            if self._update_horizon_glow_callback:
+                self._update_horizon_glow_callback("connecting")
+
+        self._ui_call(apply)
 
     def _show_disconnecting_ui(self):
         """Show disconnecting state in UI."""
-        if self._connection_button:
-            self._ui_call(self._connection_button.set_disconnecting)
-        if self._status_display:
-            self._ui_call(self._status_display.set_disconnecting)
-        if self._update_horizon_glow_callback:
-            self._ui_call(lambda: self._update_horizon_glow_callback("disconnecting"))
+
+        def apply():
+            if self._connection_button:
+                self._connection_button.set_disconnecting()
+            if self._status_display:
+                self._status_display.set_disconnecting()
+            if self._update_horizon_glow_callback:
+                self._update_horizon_glow_callback("disconnecting")
+
+        self._ui_call(apply)
 
     def _show_connected_ui(self, profile_data: dict = None):
         """Show connected state in UI."""
-        if self._status_display:
-            self._ui_call(lambda: self._status_display.set_connected(country_data=profile_data))
-        if self._connection_button:
-            self._ui_call(self._connection_button.set_connected)
-        if self._update_horizon_glow_callback:
-            self._ui_call(lambda: self._update_horizon_glow_callback("connected"))
+
+        def apply():
+            if self._status_display:
+                self._status_display.set_connected(country_data=profile_data)
+            if self._connection_button:
+                self._connection_button.set_connected()
+            if self._update_horizon_glow_callback:
+                self._update_horizon_glow_callback("connected")
+
+        self._ui_call(apply)
         if self._systray:
             self._systray.update_state()
         self._update_lan_card()
@@ -202,12 +258,6 @@ class ConnectionHandler:
             show = bool(self._app_context.settings.get_allow_lan())
         self._ui_call(lambda: self._lan_card_callback(show))
 
-    def _show_toast(self, msg_key: str, toast_type: str = "error", duration: int = 3000):
-        """Show toast notification."""
-        if self._toast:
-            method = getattr(self._toast, toast_type, self._toast.error)
-            self._ui_call(lambda: method(t(msg_key), duration))
-
     def reset_ui_disconnected(self):
         """Reset UI to disconnected state."""
         self._set_running_state(False)
@@ -259,12 +309,8 @@ class ConnectionHandler:
 
     def _check_internet(self) -> bool:
         """Check internet connectivity before connecting."""
-        from src.utils.network_utils import NetworkUtils
-
         if not NetworkUtils.check_internet_connection():
-            self._set_connecting(False)
-            self._ui_call(self.reset_ui_disconnected)
-            self._show_toast("connection.no_internet")
+            self._handle_connection_failure("connection.no_internet")
             return False
         return True
 
@@ -310,8 +356,10 @@ class ConnectionHandler:
         else:
             profile_config = profile.get("config") if profile else {}
 
-        with open(config_path, "w", encoding="utf-8") as f:
-            json.dump(profile_config, f)
+        # One-shot dumps (instead of json.dump's chunked writes) into a temp file
+        # that is swapped in, so the core never reads a half-written config
+        if not atomic_write(config_path, json.dumps(profile_config)):
+            raise OSError(f"Could not write {config_path}")
 
         return config_path
 
@@ -325,9 +373,7 @@ class ConnectionHandler:
         success = self._connection_manager.connect(config_path, mode_str, step_callback=on_step)
 
         if not success:
-            self._set_connecting(False)
-            self._ui_call(self.reset_ui_disconnected)
-            self._show_toast("status.connection_failed")
+            self._handle_connection_failure("status.connection_failed")
 
         return success
 
@@ -340,8 +386,6 @@ class ConnectionHandler:
         mode) can return false negatives once the TUN filters fully engage, so a
         failure here is logged but never tears down a healthy connection.
         """
-        from src.utils.network_utils import NetworkUtils
-
         time.sleep(2.0)  # Allow the tunnel + fragmented/finalmask streams to stabilize
 
         if self._status_display:
@@ -401,10 +445,16 @@ class ConnectionHandler:
         except Exception as e:
             logger.warning(f"[ConnectionHandler] Failed to start network stats: {e}")
 
-    def _handle_connection_failure(self):
-        """Handle connection failure cleanup."""
+    def _handle_connection_failure(self, msg_key: Optional[str] = None):
+        """Handle connection failure cleanup, with an optional error toast."""
         self._set_connecting(False)
-        self._ui_call(self.reset_ui_disconnected)
+
+        def apply():
+            self.reset_ui_disconnected()
+            if msg_key and self._toast:
+                self._toast.error(t(msg_key), 3000)
+
+        self._ui_call(apply)
 
     # -------------------------------------------------------------------------
     # Reconnect Task
@@ -432,6 +482,7 @@ class ConnectionHandler:
 
     def _disconnect_task(self):
         """Disconnect task - runs in background thread."""
+        started = time.monotonic()
         self._set_running_state(False)
         self._stop_network_stats()
 
@@ -442,7 +493,11 @@ class ConnectionHandler:
 
         self._stop_log_tailing()
 
-        time.sleep(1.0)  # Allow UI to show disconnecting state
+        # Keep the disconnecting state on screen for at least a second. Teardown
+        # is synchronous, so only the part of that second it did not use is waited
+        remaining = _MIN_DISCONNECTING_SECONDS - (time.monotonic() - started)
+        if remaining > 0:
+            time.sleep(remaining)
 
         self._ui_call(self.reset_ui_disconnected)
 
@@ -104,9 +104,13 @@ class LatencyMonitorHandler:
             is_running = self._is_running_getter() if self._is_running_getter else False
             connecting = self._connecting_getter() if self._connecting_getter else False
 
+            selected = self._selected_profile_getter() if self._selected_profile_getter else None
+            # A check can outlive a server switch; its result then belongs to a card no longer shown
+            is_current = selected is not None and selected.get("id") == profile.get("id")
+
             # Ensure we still meet conditions when result returns
             if not is_running and not connecting:
-                if self._ui_helper and self._status_display:
+                if is_current and self._ui_helper and self._status_display:
                     self._ui_helper.call(
                         self._status_display.set_pre_connection_ping,
                         result_str,
@@ -118,7 +122,7 @@ class LatencyMonitorHandler:
                     self._app_context.profiles.update(profile.get("id"), country_data)
                     # Update display
                     if self._ui_helper:
-                        if self._server_card:
+                        if is_current and self._server_card:
                             self._ui_helper.call(lambda: self._server_card.update_server(profile))
 
                         if country_data.get("country_code") and self._server_list:
@@ -61,6 +61,8 @@ class NetworkStatsHandler:
         Polls shared state from service and updates UI.
         Runs on main UI thread (Async), does NOT block.
         """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
         while True:
             try:
                 # 1. Lifecycle Check
@@ -68,16 +70,32 @@ class NetworkStatsHandler:
                     await asyncio.sleep(1.0)
                     continue
 
-                # 2. Update UI
+                # 2. Update UI (skipped while hidden in the tray or minimized)
+                if self._window_hidden():
+                    await asyncio.sleep(1.0)
+                    continue
                 self._update_ui()
 
-                # 3. Timing Control
-                await asyncio.sleep(1.5)
+                # 3. Timing Control: tick on a fixed 1.5s cadence, so the cost of
+                # _update_ui() is absorbed instead of accumulating as drift
+                deadline += 1.5
+                now = loop.time()
+                if deadline <= now:
+                    # Fell behind (loop was busy or we were idle); resync
+                    deadline = now + 1.5
+                await asyncio.sleep(deadline - now)
 
             except Exception as e:
                 logger.error(f"Error in stats UI loop: {e}")
                 await asyncio.sleep(1.5)
 
+    def _window_hidden(self) -> bool:
+        """Whether the app window is currently not visible to the user."""
+        window = getattr(self._page, "window", None)
+        if window is None:
+            return False
+        return window.visible is False or window.minimized is True
+
     def update_ui_immediately(self):
         """Triggers an immediate UI update if possible."""
         try:
@@ -127,9 +145,13 @@ class NetworkStatsHandler:
 
             # Clamp opacity to valid range [0.0, 1.0]
             calculated_opacity = base_opacity + (0.5 * intensity)
-            self._earth_glow.opacity = min(1.0, max(0.0, calculated_opacity))
-            self._earth_glow.scale = base_scale + (0.2 * intensity)
-            self._earth_glow.update()
+            # Quantize, so a steady throughput doesn't resend an identical glow every tick
+            opacity = round(min(1.0, max(0.0, calculated_opacity)), 2)
+            scale = round(base_scale + (0.2 * intensity), 3)
+            if opacity != self._earth_glow.opacity or scale != self._earth_glow.scale:
+                self._earth_glow.opacity = opacity
+                self._earth_glow.scale = scale
+                self._earth_glow.update()
 
         # Heartbeat logic
         if self._logs_heartbeat and self._page_attached(self._logs_heartbeat):
@@ -9,6 +9,35 @@ if TYPE_CHECKING:
     from src.ui.main_window import MainWindow
 
 
+# Rim light per state: (gradient colors, opacity); "disconnected" only fades out
+_GLOW_STATES = {
+    "connecting": (  # Amber rim light
+        [
+            ft.Colors.with_opacity(0.8, ft.Colors.AMBER),
+            ft.Colors.with_opacity(0.3, ft.Colors.AMBER_700),
+            ft.Colors.with_opacity(0.0, ft.Colors.TRANSPARENT),
+        ],
+        1.0,
+    ),
+    "connected": (  # Purple rim light
+        [
+            ft.Colors.with_opacity(0.6, ft.Colors.PURPLE),
+            ft.Colors.with_opacity(0.2, ft.Colors.PURPLE_700),
+            ft.Colors.with_opacity(0.0, ft.Colors.TRANSPARENT),
+        ],
+        0.8,
+    ),
+    "disconnecting": (  # Red rim light
+        [
+            ft.Colors.with_opacity(0.8, ft.Colors.RED),
+            ft.Colors.with_opacity(0.3, ft.Colors.RED_700),
+            ft.Colors.with_opacity(0.0, ft.Colors.TRANSPARENT),
+        ],
+        1.0,
+    ),
+}
+
+
 class GlowHelper:
     """Manages Earth horizon glow effects."""
 
@@ -22,38 +51,20 @@ class GlowHelper:
         Args:
             state: 'connecting', 'connected', or 'disconnected'
         """
-        if not self._main._earth_glow:
+        glow = self._main._earth_glow
+        if not glow:
             return
 
-        if state == "connecting":
-            # Amber rim light
-            self._main._earth_glow.gradient.colors = [
-                ft.Colors.with_opacity(0.8, ft.Colors.AMBER),
-                ft.Colors.with_opacity(0.3, ft.Colors.AMBER_700),
-                ft.Colors.with_opacity(0.0, ft.Colors.TRANSPARENT),
-            ]
-            self._main._earth_glow.opacity = 1.0
-
-        elif state == "connected":
-            # Purple rim light
-            self._main._earth_glow.gradient.colors = [
-                ft.Colors.with_opacity(0.6, ft.Colors.PURPLE),
-                ft.Colors.with_opacity(0.2, ft.Colors.PURPLE_700),
-                ft.Colors.with_opacity(0.0, ft.Colors.TRANSPARENT),
-            ]
-            self._main._earth_glow.opacity = 0.8
-
-        elif state == "disconnecting":
-            # Red rim light
-            self._main._earth_glow.gradient.colors = [
-                ft.Colors.with_opacity(0.8, ft.Colors.RED),
-                ft.Colors.with_opacity(0.3, ft.Colors.RED_700),
-                ft.Colors.with_opacity(0.0, ft.Colors.TRANSPARENT),
-            ]
-            self._main._earth_glow.opacity = 1.0
-
-        else:  # disconnected
-            self._main._earth_glow.opacity = 0.0
-
-        if self._main._earth_glow.page:
-            self._main._earth_glow.update()
+        colors, opacity = _GLOW_STATES.get(state, (None, 0.0))
+        # Compared against the glow itself rather than the last state, since the
+        # stats loop also drives its opacity while connected
+        recolor = colors is not None and glow.gradient.colors != colors
+        if not recolor and glow.opacity == opacity:
+            return  # Repeated transition: nothing visible would change
+
+        if recolor:
+            glow.gradient.colors = colors  # Shared palette, never mutated
+        glow.opacity = opacity
+
+        if glow.page:
+            glow.update()
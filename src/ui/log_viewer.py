@@ -9,6 +9,9 @@ import flet as ft
 
 from src.core.logger import logger
 
+# Upper bound on what one poll reads per file; the viewer keeps far less than this
+_READ_CHUNK = 64 * 1024
+
 
 class LogViewer:
     """Component for viewing log files in real-time using Flet."""
@@ -64,6 +67,7 @@ class LogViewer:
         def tail_log():
             file_handles = {}
             last_inodes = {}
+            partial_lines = {}  # Trailing text of a line not yet terminated
 
             while not stop_event.is_set():
                 # --- تغییر ۱: چک کردن وضعیت مکث ---
@@ -79,14 +83,24 @@ class LogViewer:
                         if last_inodes.get(filepath) != stat.st_ino:
                             if filepath in file_handles:
                                 file_handles[filepath].close()
-                            file_handles[filepath] = open(filepath, "r", encoding="utf-8", errors="replace")
+                            file_handles[filepath] = open(
+                                filepath, "r", encoding="utf-8", errors="replace", buffering=_READ_CHUNK
+                            )
                             file_handles[filepath].seek(0, os.SEEK_END)
                             last_inodes[filepath] = stat.st_ino
+                            partial_lines.pop(filepath, None)
 
                         if filepath in file_handles:
-                            line = file_handles[filepath].readline()
-                            if line:
-                                self._append_text(line)
+                            # Take everything written since the last poll (not one line per
+                            # poll), and hand it to the UI as a single update
+                            data = file_handles[filepath].read(_READ_CHUNK)
+                            if data:
+                                lines = (partial_lines.pop(filepath, "") + data).split("\n")
+                                if lines[-1]:
+                                    partial_lines[filepath] = lines[-1]
+                                if len(lines) > 1:
+                                    # Newest first, matching the viewer's order
+                                    self._append_text("\n".join(reversed(lines[:-1])))
 
                     except Exception as e:
                         logger.error(f"Error reading log file {filepath}: {e}")
@@ -151,7 +165,13 @@ class LogViewer:
                 if len(self._log_text.value) > self.MAX_CHARS + 2000:
                     self._log_text.value = self._log_text.value[: self.MAX_CHARS]
 
-                self._page.update()
+                # Only the log field changed; no need to diff the whole page per line.
+                # While the logs drawer is swapped out the text simply accumulates
+                # and goes out with the drawer when it is mounted again.
+                try:
+                    self._log_text.update()
+                except RuntimeError:
+                    pass
 
             try:
                 self._page.run_task(update_ui)
@@ -1,8 +1,7 @@
 """Drawer Manager - Manages drawer initialization and opening."""
 from __future__ import annotations
 
-import threading
-import time
+import asyncio
 from typing import TYPE_CHECKING
 
 import flet as ft
@@ -142,16 +141,18 @@ class DrawerManager:
     def _safe_update_server_list(self):
         """Wait for sheet to be mounted before updating list."""
 
-        def _wait_and_update():
+        async def _wait_and_update():
             max_wait = 2
-            start = time.time()
-            while time.time() - start < max_wait:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + max_wait
+            while loop.time() < deadline:
                 if self._main._server_sheet and self._main._server_sheet.page:
                     try:
+                        # Heavy loading runs on its own worker thread
                         self._main._server_list._load_profiles(update_ui=True)
                     except Exception:
                         pass
                     break
-                time.sleep(0.05)
+                await asyncio.sleep(0.05)
 
-        threading.Thread(target=_wait_and_update, daemon=True).start()
+        self._main._page.run_task(_wait_and_update)
@@ -179,6 +179,26 @@ class TestAppContext:
         ctx.settings.set_remember_close_choice(True)
         assert ctx.settings.get_remember_close_choice() is True
 
+    def test_settings_unchanged_value_not_rewritten(self, ctx):
+        """Saving the value already on disk must not touch the file."""
+        ctx.settings.set_proxy_port(9999)
+        with patch("src.repositories.settings_repository.atomic_write") as mock_write:
+            ctx.settings.set_proxy_port(9999)
+            mock_write.assert_not_called()
+            ctx.settings.set_proxy_port(9998)
+            mock_write.assert_called_once()
+
+    def test_settings_read_sees_external_change(self, ctx, temp_config_dir):
+        """Cached setting values are refreshed when the file changes on disk."""
+        ctx.settings.set_sort_mode("ping_asc")
+        assert ctx.settings.get_sort_mode() == "ping_asc"
+
+        (temp_config_dir / "sort_mode.txt").write_text("ping_desc")
+        assert ctx.settings.get_sort_mode() == "ping_desc"
+
+        (temp_config_dir / "sort_mode.txt").unlink()
+        assert ctx.settings.get_sort_mode() == "name_asc"
+
     def test_load_config_real_file(self, ctx, temp_config_dir):
         """Test load_config with a real file."""
         config_path = temp_config_dir / "real_config.json"
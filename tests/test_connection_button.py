@@ -0,0 +1,73 @@
+"""Tests for the ConnectionButton glow pulse."""
+
+import asyncio
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+
+from src.ui.components.connection_button import ConnectionButton
+
+
+@pytest.fixture
+def button():
+    page = MagicMock()
+    with patch.object(ConnectionButton, "page", new_callable=PropertyMock, return_value=page):
+        btn = ConnectionButton(on_click=None)
+        btn.update = MagicMock()
+        yield btn, page
+
+
+class TestPulse:
+    """All pulsing states share a single background loop."""
+
+    def test_state_flips_start_one_loop(self, button):
+        btn, page = button
+        btn.set_connecting()
+        btn.set_connected()
+        btn.set_connecting()
+        btn.set_disconnecting()
+        page.run_task.assert_called_once_with(btn._pulse_loop)
+
+    def test_loop_restarts_after_it_finishes(self, button):
+        btn, page = button
+        btn.set_connecting()
+        btn._pulse_running = False  # loop exited after a disconnect
+        btn.set_connected()
+        assert page.run_task.call_count == 2
+
+    def test_disconnected_does_not_pulse(self, button):
+        btn, page = button
+        btn.set_disconnected()
+        page.run_task.assert_not_called()
+
+    def test_loop_follows_state_and_exits(self, button):
+        btn, _ = button
+        btn._glow_layer.update = MagicMock()
+        btn.set_connecting()
+        beats = []
+
+        async def fake_sleep(period):
+            beats.append(period)
+            btn._state = {1: "disconnecting", 2: "disconnected"}.get(len(beats), btn._state)
+
+        with patch("src.ui.components.connection_button.asyncio.sleep", fake_sleep):
+            asyncio.run(btn._pulse_loop())
+
+        assert beats == [0.8, 0.4]
+        assert btn._pulse_running is False
+
+
+class TestNetworkActivity:
+    """Activity updates reshape the existing glow shadow."""
+
+    def test_shadow_is_updated_in_place(self, button):
+        btn, _ = button
+        btn._glow_layer.update = MagicMock()
+        btn.set_connected()
+        shadow = btn._glow_layer.shadow
+
+        btn.update_network_activity(5000 * 1024)
+
+        assert btn._glow_layer.shadow is shadow
+        assert shadow.blur_radius > 30
+        btn._glow_layer.update.assert_called()
@@ -1,11 +1,22 @@
-"""Tests for ConnectionHandler post-connection verification."""
+"""Tests for ConnectionHandler task ordering and post-connection verification."""
 
+import json
+import threading
 from unittest.mock import MagicMock, patch
 
 from src.core.types import ConnectionMode
 from src.ui.handlers.connection_handler import ConnectionHandler
 
 
+def _handler(with_stats: bool = True):
+    """Build a handler over mocked collaborators."""
+    return ConnectionHandler(
+        connection_manager=MagicMock(),
+        app_context=MagicMock(),
+        network_stats=MagicMock() if with_stats else None,
+    )
+
+
 class TestPostConnectionCheck:
     """Post-connection verification must match the active connection mode."""
 
@@ -42,12 +53,8 @@ class TestPostConnectionCheck:
 class TestVerifyPostConnection:
     """Post-connection re-check is advisory: it never tears down a connection."""
 
-    def _handler(self):
-        handler = ConnectionHandler(
-            connection_manager=MagicMock(),
-            app_context=MagicMock(),
-            network_stats=MagicMock(),
-        )
+    def _vpn_handler(self):
+        handler = _handler()
         handler._current_mode_getter = lambda: ConnectionMode.VPN
         handler._app_context.settings.get_proxy_port.return_value = 10805
         return handler
@@ -56,7 +63,7 @@ class TestVerifyPostConnection:
     @patch.object(ConnectionHandler, "_post_connection_check")
     def test_success_on_first_attempt(self, mock_check, mock_sleep):
         """A passing probe confirms the connection."""
-        handler = self._handler()
+        handler = self._vpn_handler()
         mock_check.return_value = True
 
         ok = handler._verify_post_connection()
@@ -69,7 +76,7 @@ class TestVerifyPostConnection:
     @patch.object(ConnectionHandler, "_post_connection_check")
     def test_transient_failure_then_success(self, mock_check, mock_sleep):
         """A transient failure followed by success does NOT tear down."""
-        handler = self._handler()
+        handler = self._vpn_handler()
         mock_check.side_effect = [False, True]
 
         ok = handler._verify_post_connection()
@@ -82,7 +89,7 @@ class TestVerifyPostConnection:
     @patch.object(ConnectionHandler, "_post_connection_check")
     def test_persistent_failure_keeps_connection(self, mock_check, mock_sleep):
         """Persistent probe failures do NOT tear down a verified-healthy connection."""
-        handler = self._handler()
+        handler = self._vpn_handler()
         mock_check.return_value = False
 
         ok = handler._verify_post_connection()
@@ -90,3 +97,142 @@ class TestVerifyPostConnection:
         assert ok is True
         assert mock_check.call_count == 2
         handler._connection_manager.disconnect.assert_not_called()
+
+
+class TestTaskOrdering:
+    """Connection tasks run one at a time, in the order they were requested."""
+
+    def test_connect_waits_for_disconnect(self):
+        handler = _handler()
+        handler._is_running_getter = lambda: True
+        release = threading.Event()
+        order = []
+
+        def slow_disconnect():
+            release.wait(5)
+            order.append("disconnect")
+
+        with (
+            patch.object(handler, "_disconnect_task", slow_disconnect),
+            patch.object(handler, "_perform_connect_task", lambda: order.append("connect")),
+        ):
+            handler.disconnect()
+            handler.connect_async()
+            assert order == []
+
+            release.set()
+            handler._pending.result(timeout=5)
+
+        assert order == ["disconnect", "connect"]
+
+    def test_disconnect_cancels_queued_connect(self):
+        handler = _handler()
+        handler._is_running_getter = lambda: True
+        connecting = {"value": False}
+        handler._connecting_getter = lambda: connecting["value"]
+        handler._connecting_setter = lambda value: connecting.update(value=value)
+        release = threading.Event()
+        order = []
+
+        def slow_disconnect():
+            release.wait(5)
+            order.append("disconnect")
+
+        with (
+            patch.object(handler, "_disconnect_task", slow_disconnect),
+            patch.object(handler, "_perform_connect_task", lambda: order.append("connect")),
+        ):
+            handler.disconnect()
+            handler.connect_async()
+            queued_connect = handler._pending
+            handler.disconnect()
+
+            release.set()
+            handler._pending.result(timeout=5)
+
+        assert queued_connect.cancelled()
+        assert connecting["value"] is False
+        assert order == ["disconnect", "disconnect"]
+
+
+class TestStateTransitions:
+    """A state transition reaches the UI loop as a single callback."""
+
+    def test_connected_ui_is_one_ui_call(self):
+        handler = _handler()
+        ui_helper = MagicMock()
+        handler._ui_helper = ui_helper
+        handler._connection_button = MagicMock()
+        handler._status_display = MagicMock()
+        handler._update_horizon_glow_callback = MagicMock()
+
+        handler._show_connected_ui({"id": "a"})
+        ui_helper.call.assert_called_once()
+
+        ui_helper.call.call_args.args[0]()
+        handler._status_display.set_connected.assert_called_once_with(country_data={"id": "a"})
+        handler._connection_button.set_connected.assert_called_once()
+        handler._update_horizon_glow_callback.assert_called_once_with("connected")
+
+
+class TestWriteTempConfig:
+    """The connect config is swapped in whole, never left half-written."""
+
+    def test_config_written_atomically(self, tmp_path):
+        handler = _handler()
+        config = {"outbounds": [{"protocol": "vless"}]}
+
+        with patch("src.ui.handlers.connection_handler.TMPDIR", str(tmp_path)):
+            path = handler._write_temp_config({"config": config})
+
+        assert json.loads((tmp_path / "current_config.json").read_text(encoding="utf-8")) == config
+        assert path == str(tmp_path / "current_config.json")
+        assert [p.name for p in tmp_path.iterdir()] == ["current_config.json"]
+
+
+class TestDisconnectTask:
+    """The disconnecting state lasts about a second, including teardown time."""
+
+    def _run(self, teardown_seconds):
+        clock = [100.0]
+        handler = _handler(with_stats=False)
+
+        def teardown():
+            clock[0] += teardown_seconds
+
+        handler._connection_manager.disconnect.side_effect = teardown
+        with (
+            patch("src.ui.handlers.connection_handler.time.monotonic", lambda: clock[0]),
+            patch("src.ui.handlers.connection_handler.time.sleep") as sleep,
+        ):
+            handler._disconnect_task()
+        return sleep
+
+    def test_fast_teardown_waits_the_remainder(self):
+        sleep = self._run(0.25)
+        sleep.assert_called_once_with(0.75)
+
+    def test_slow_teardown_does_not_wait(self):
+        sleep = self._run(1.5)
+        sleep.assert_not_called()
+
+
+class TestConnectionFailure:
+    """A failed connect resets the UI and shows its toast in one UI callback."""
+
+    def test_failure_is_one_ui_call(self):
+        handler = _handler()
+        handler._ui_helper = MagicMock()
+        handler._toast = MagicMock()
+        connecting = []
+        handler._connecting_setter = connecting.append
+        handler._connection_manager.connect.return_value = False
+
+        with patch.object(handler, "reset_ui_disconnected") as reset:
+            assert handler._establish_connection("config.json", "proxy") is False
+            handler._ui_helper.call.assert_called_once()
+            handler._ui_helper.call.call_args.args[0]()
+
+        assert connecting == [False]
+        reset.assert_called_once()
+        handler._toast.error.assert_called_once()
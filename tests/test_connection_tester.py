@@ -0,0 +1,47 @@
+"""Tests for ConnectionTester's Xray-instance probe."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from src.services.connection_tester import ConnectionTester
+
+_PROFILE = {"outbounds": [{"protocol": "vless", "settings": {}}]}
+
+
+@pytest.fixture
+def session(tmp_path):
+    """Run test_connection_sync against a stubbed Xray process and HTTP session."""
+    with (
+        patch("src.services.connection_tester.TMPDIR", str(tmp_path)),
+        patch("src.services.connection_tester.subprocess.Popen") as popen,
+        patch("src.services.connection_tester.time.sleep"),
+        patch("src.services.connection_tester.requests.Session") as session_cls,
+    ):
+        popen.return_value.poll.return_value = None
+        yield session_cls.return_value
+
+
+class TestProbeSession:
+    """Retries and the geo lookup share one HTTP session."""
+
+    def test_retries_reuse_session(self, session):
+        session.get.side_effect = [requests.exceptions.ConnectionError(), MagicMock(status_code=204)]
+
+        success, _, _ = ConnectionTester.test_connection_sync(_PROFILE)
+
+        assert success is True
+        assert session.get.call_count == 2
+        session.close.assert_called_once()
+
+    def test_geo_lookup_uses_same_session(self, session):
+        geo = MagicMock(status_code=200)
+        geo.json.return_value = {"status": "success", "countryCode": "DE", "country": "Germany", "city": "Berlin"}
+        session.get.side_effect = [MagicMock(status_code=204), geo]
+
+        success, _, country = ConnectionTester.test_connection_sync(_PROFILE, fetch_country=True)
+
+        assert success is True
+        assert country == {"country_code": "DE", "country_name": "Germany", "city": "Berlin"}
+        session.close.assert_called_once()
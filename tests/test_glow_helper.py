@@ -0,0 +1,48 @@
+"""Tests for the horizon glow helper."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import flet as ft
+import pytest
+
+from src.ui.helpers.glow_helper import GlowHelper
+
+
+@pytest.fixture
+def glow():
+    earth_glow = ft.Container(
+        gradient=ft.RadialGradient(colors=[ft.Colors.TRANSPARENT, ft.Colors.TRANSPARENT]),
+        opacity=0.0,
+    )
+    earth_glow.update = MagicMock()
+    with patch.object(ft.Container, "page", new_callable=PropertyMock, return_value=MagicMock()):
+        yield GlowHelper(SimpleNamespace(_earth_glow=earth_glow)), earth_glow
+
+
+class TestHorizonGlow:
+    """The glow is only resent when a transition changes what it shows."""
+
+    def test_repeated_state_updates_once(self, glow):
+        helper, earth_glow = glow
+        helper.update_horizon_glow("connected")
+        colors = earth_glow.gradient.colors
+        helper.update_horizon_glow("connected")
+
+        earth_glow.update.assert_called_once()
+        assert earth_glow.opacity == 0.8
+        assert earth_glow.gradient.colors is colors
+
+    def test_disconnected_while_hidden_is_skipped(self, glow):
+        helper, earth_glow = glow
+        helper.update_horizon_glow("disconnected")
+        earth_glow.update.assert_not_called()
+
+    def test_opacity_changed_elsewhere_is_restored(self, glow):
+        helper, earth_glow = glow
+        helper.update_horizon_glow("disconnected")
+        earth_glow.opacity = 0.3  # e.g. a late network stats tick
+
+        helper.update_horizon_glow("disconnected")
+        assert earth_glow.opacity == 0.0
+        earth_glow.update.assert_called_once()
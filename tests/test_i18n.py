@@ -90,6 +90,24 @@ class TestI18n:
         assert i18n.t("both") == "هر دو"
         assert i18n.t("only_en") == "English Only"
 
+    def test_cached_lookup_follows_language(self):
+        """Memoized lookups must not leak across a language switch or reload."""
+        i18n = I18n()
+        i18n._translations = {"en": {"greet": "Hello"}, "fa": {"greet": "سلام"}}
+        i18n._initialized = True
+
+        assert i18n.t("greet") == "Hello"
+        i18n.set_language("fa")
+        assert i18n.t("greet") == "سلام"
+        i18n.set_language("en")
+        assert i18n.t("greet") == "Hello"
+
+        with patch("builtins.open", mock_open(read_data=json.dumps({"greet": "Hi"}))), patch(
+            "os.path.exists", return_value=True
+        ):
+            i18n._load_lang("en")
+        assert i18n.t("greet") == "Hi"
+
     def test_rtl_check(self):
         """Test RTL detection."""
         set_language("en")
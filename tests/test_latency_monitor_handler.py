@@ -0,0 +1,56 @@
+"""Tests for LatencyMonitorHandler result delivery."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.ui.handlers.latency_monitor_handler import LatencyMonitorHandler
+
+
+@pytest.fixture
+def handler():
+    handler = LatencyMonitorHandler(MagicMock())
+    state = {"profile": {"id": "a", "name": "A", "config": {"outbounds": []}}}
+    ui_helper = MagicMock()
+    ui_helper.call.side_effect = lambda fn, *args: fn(*args)
+    handler.setup(
+        page=MagicMock(),
+        status_display=MagicMock(),
+        server_card=MagicMock(),
+        server_list=MagicMock(),
+        ui_helper=ui_helper,
+        is_running_getter=lambda: False,
+        connecting_getter=lambda: False,
+        selected_profile_getter=lambda: state["profile"],
+    )
+    return handler, state
+
+
+def _run_check(handler):
+    """Start a check and return the callback ConnectionTester would invoke."""
+    with patch("src.ui.handlers.latency_monitor_handler.ConnectionTester.test_connection") as test_connection:
+        handler.trigger_single_check()
+    return test_connection.call_args.args[1]
+
+
+class TestResultDelivery:
+    """Results only reach the status display for the server still selected."""
+
+    def test_result_shown_for_selected_server(self, handler):
+        handler, _ = handler
+        on_result = _run_check(handler)
+
+        on_result(True, "120 ms", {"country_code": "DE"})
+        handler._status_display.set_pre_connection_ping.assert_called_once_with("120 ms", True)
+        handler._server_card.update_server.assert_called_once()
+
+    def test_stale_result_is_not_shown(self, handler):
+        handler, state = handler
+        on_result = _run_check(handler)
+        state["profile"] = {"id": "b", "name": "B", "config": {"outbounds": []}}
+
+        on_result(True, "120 ms", {"country_code": "DE"})
+        handler._status_display.set_pre_connection_ping.assert_not_called()
+        handler._server_card.update_server.assert_not_called()
+        # The resolved country still belongs to the profile that was checked
+        handler._app_context.profiles.update.assert_called_once_with("a", {"country_code": "DE"})
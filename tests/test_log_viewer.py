@@ -0,0 +1,72 @@
+"""Tests for LogViewer file tailing."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.ui.log_viewer import LogViewer
+
+
+@pytest.fixture
+def viewer():
+    viewer = LogViewer("Logs")
+    viewer._log_text.update = MagicMock()
+    page = MagicMock()
+    page.run_task.side_effect = lambda coro_fn: asyncio.run(coro_fn())
+    viewer.set_page(page)
+    yield viewer, page
+    viewer.stop_tailing()
+
+
+@pytest.fixture
+def polls(monkeypatch):
+    """Count finished tail polls; the tail thread sleeps once at the end of each."""
+    count = [0]
+    real_sleep = time.sleep
+
+    def sleep(seconds):
+        if threading.current_thread() is threading.main_thread():
+            real_sleep(seconds)
+        else:
+            count[0] += 1
+            real_sleep(0.01)
+
+    monkeypatch.setattr("src.ui.log_viewer.time.sleep", sleep)
+    return count
+
+
+def _wait_for(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return False
+
+
+class TestTailing:
+    """New log output is picked up per poll, not one line per poll."""
+
+    def test_burst_arrives_in_one_update(self, viewer, polls, tmp_path):
+        viewer, page = viewer
+        log = tmp_path / "xray.log"
+        log.write_text("old line\n", encoding="utf-8")
+        viewer.start_tailing(str(log))
+        # The first poll opens the file at its current end
+        assert _wait_for(lambda: polls[0] >= 1)
+
+        with open(log, "a", encoding="utf-8") as f:
+            f.write("one\ntwo\nthree\npart")
+
+        assert _wait_for(lambda: viewer._log_text.value)
+        assert viewer._log_text.value == "three\ntwo\none"
+        assert page.run_task.call_count == 1
+
+        with open(log, "a", encoding="utf-8") as f:
+            f.write("ial\n")
+
+        assert _wait_for(lambda: page.run_task.call_count == 2)
+        assert viewer._log_text.value == "partial\nthree\ntwo\none"
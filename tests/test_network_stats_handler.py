@@ -0,0 +1,49 @@
+"""Tests for NetworkStatsHandler UI syncing."""
+
+from unittest.mock import MagicMock
+
+import flet as ft
+
+from src.ui.handlers.network_stats_handler import NetworkStatsHandler
+
+
+def _handler(total_bps: float):
+    stats = MagicMock()
+    stats.get_stats.return_value = {"total_bps": total_bps}
+    handler = NetworkStatsHandler(stats)
+    glow = ft.Container(opacity=0.0)
+    glow.update = MagicMock()
+    handler.setup(
+        page=MagicMock(),
+        status_display=MagicMock(),
+        connection_button=None,
+        logs_drawer_component=None,
+        earth_glow=glow,
+        logs_heartbeat=None,
+        heartbeat=None,
+        is_running_getter=lambda: True,
+    )
+    handler._page_attached = lambda control: True
+    return handler, glow
+
+
+class TestEarthGlow:
+    """The earth glow is only pushed when its visible value changes."""
+
+    def test_steady_throughput_updates_once(self):
+        handler, glow = _handler(2 * 1024 * 1024)
+        handler._update_ui()
+        handler._update_ui()
+
+        glow.update.assert_called_once()
+        assert glow.opacity == 0.5
+        assert glow.scale == 1.08
+
+    def test_throughput_change_updates_again(self):
+        handler, glow = _handler(0)
+        handler._update_ui()
+        handler._network_stats.get_stats.return_value = {"total_bps": 5 * 1024 * 1024}
+        handler._update_ui()
+
+        assert glow.update.call_count == 2
+        assert glow.opacity == 0.8
@@ -0,0 +1,49 @@
+"""Tests for ServerCard location labels."""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.ui.components import server_card
+from src.ui.components.server_card import _location_label
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    server_card._location_cache.clear()
+    yield
+    server_card._location_cache.clear()
+
+
+class TestLocationLabel:
+    """Translated "Country, City" labels are memoized per language."""
+
+    def test_label_is_translated_once(self):
+        with (
+            patch("src.ui.components.server_card.get_language", return_value="fa"),
+            patch("src.ui.components.server_card.translate_country", return_value="آلمان") as country,
+            patch("src.ui.components.server_card.translate_city", return_value="برلین") as city,
+        ):
+            assert _location_label("DE", "Germany", "Berlin") == "آلمان, برلین"
+            assert _location_label("DE", "Germany", "Berlin") == "آلمان, برلین"
+
+        country.assert_called_once_with("DE", "Germany")
+        city.assert_called_once_with("Berlin")
+
+    def test_language_change_retranslates(self):
+        with patch("src.ui.components.server_card.translate_country", side_effect=["Germany", "Германия"]):
+            with patch("src.ui.components.server_card.get_language", return_value="en"):
+                assert _location_label("DE", "Germany", None) == "Germany"
+            with patch("src.ui.components.server_card.get_language", return_value="ru"):
+                assert _location_label("DE", "Germany", None) == "Германия"
+
+    def test_cache_is_bounded(self):
+        with (
+            patch("src.ui.components.server_card.get_language", return_value="en"),
+            patch("src.ui.components.server_card.translate_country", side_effect=lambda cc, name: name),
+        ):
+            for i in range(server_card._LOCATION_CACHE_MAX + 10):
+                _location_label("DE", f"Server {i}", None)
+
+        assert len(server_card._location_cache) == server_card._LOCATION_CACHE_MAX
+        assert ("en", "DE", "Server 0", None) not in server_card._location_cache
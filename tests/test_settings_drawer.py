@@ -0,0 +1,93 @@
+"""Tests for SettingsDrawer mode switching and port saving."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core.types import ConnectionMode
+from src.ui.components.settings_drawer import SettingsDrawer
+from src.ui.components.settings_sections import PortInputRow
+
+
+@pytest.fixture
+def make_drawer():
+    """Build a SettingsDrawer with its OS/background dependencies stubbed."""
+
+    def _make(mode: ConnectionMode, is_admin: bool):
+        on_mode_changed = MagicMock()
+        with (
+            patch("src.ui.components.settings_drawer.ProcessUtils.is_admin", return_value=is_admin),
+            patch("src.ui.components.settings_drawer.task_scheduler") as scheduler,
+            patch("src.ui.components.settings_drawer.threading.Thread"),
+        ):
+            scheduler.is_task_registered.return_value = False
+            scheduler.is_supported.return_value = True
+            drawer = SettingsDrawer(
+                app_context=MagicMock(),
+                on_installer_run=MagicMock(),
+                on_mode_changed=on_mode_changed,
+                get_current_mode=lambda: mode,
+                navigate_to=MagicMock(),
+                navigate_back=MagicMock(),
+            )
+        drawer._show_admin_restart_dialog = MagicMock()
+        return drawer, on_mode_changed
+
+    return _make
+
+
+def _switch_event(is_proxy: bool):
+    return SimpleNamespace(control=SimpleNamespace(value=is_proxy))
+
+
+class TestModeChange:
+    """_handle_mode_change only forwards real, permitted mode changes."""
+
+    def test_vpn_without_admin_reverts_without_mode_change(self, make_drawer):
+        drawer, on_mode_changed = make_drawer(ConnectionMode.PROXY, is_admin=False)
+        drawer._handle_mode_change(_switch_event(False))
+
+        assert drawer._mode_switch_row.value is True
+        drawer._show_admin_restart_dialog.assert_called_once()
+        on_mode_changed.assert_not_called()
+
+    def test_same_mode_is_ignored(self, make_drawer):
+        drawer, on_mode_changed = make_drawer(ConnectionMode.PROXY, is_admin=True)
+        drawer._handle_mode_change(_switch_event(True))
+        on_mode_changed.assert_not_called()
+
+    def test_mode_change_forwarded_once(self, make_drawer):
+        drawer, on_mode_changed = make_drawer(ConnectionMode.PROXY, is_admin=True)
+        drawer._handle_mode_change(_switch_event(False))
+        drawer._handle_mode_change(_switch_event(False))
+        on_mode_changed.assert_called_once_with(ConnectionMode.VPN)
+
+
+class TestPortSave:
+    """PortInputRow only forwards values that differ from the stored port."""
+
+    def test_unchanged_port_is_not_resaved(self):
+        on_save = MagicMock(return_value=True)
+        row = PortInputRow(10805, on_save)
+
+        row._submit(None)
+        on_save.assert_not_called()
+
+    def test_saved_port_is_not_resubmitted(self):
+        on_save = MagicMock(return_value=True)
+        row = PortInputRow(10805, on_save)
+        row._field.value = " 20000 "
+
+        row._submit(None)
+        row._submit(None)
+        on_save.assert_called_once_with("20000")
+
+    def test_rejected_port_is_resubmitted(self):
+        on_save = MagicMock(return_value=False)
+        row = PortInputRow(10805, on_save)
+        row._field.value = "80"
+
+        row._submit(None)
+        row._submit(None)
+        assert on_save.call_count == 2
@@ -0,0 +1,41 @@
+"""Tests for the lazily built settings section controls."""
+
+from unittest.mock import patch
+
+import flet as ft
+
+from src.ui.components.settings_sections import LazyText, SettingsListTile, SettingsRow
+
+
+class TestBuildOnce:
+    """Re-adding a control (e.g. reopening the drawer) reuses its first build."""
+
+    def test_row_content_built_once(self):
+        row = SettingsRow(ft.Icons.LANGUAGE, "Language", ft.Switch())
+        assert row.content is None
+
+        row.build()
+        content = row.content
+        row.build()
+
+        assert row.content is content
+
+    def test_list_tile_children_built_once(self):
+        tile = SettingsListTile(ft.Icons.INFO, "About", "Version")
+
+        tile.build()
+        title, trailing = tile.title, tile.trailing
+        tile.build()
+
+        assert tile.title is title
+        assert tile.trailing is trailing
+
+    def test_lazy_text_resolved_once(self):
+        text = LazyText("settings.language")
+
+        with patch("src.ui.components.settings_sections.t", return_value="Language") as lookup:
+            text.build()
+            text.build()
+
+        assert text.value == "Language"
+        lookup.assert_called_once_with("settings.language")
@@ -0,0 +1,104 @@
+"""Tests for the StatusDisplay label transitions."""
+
+from unittest.mock import MagicMock
+
+import flet as ft
+
+from src.ui.components.status_display import StatusDisplay
+
+
+def _display():
+    display = StatusDisplay()
+    display.update = MagicMock()
+    return display
+
+
+class TestLabelUpdates:
+    """Progress messages edit the label in place; state changes cross-fade."""
+
+    def test_same_status_is_skipped(self):
+        display = _display()
+        display.set_step("Checking")
+        label = display._switcher.content
+
+        display.set_step("Checking")
+        assert display._switcher.content is label
+        display.update.assert_called_once()
+
+    def test_step_updates_label_in_place(self):
+        display = _display()
+        label = display._switcher.content
+        display.set_step("Checking")
+        display.set_step("Connecting")
+
+        assert display._switcher.content is label
+        assert label.value == "Connecting"
+        assert display.update.call_count == 2
+
+    def test_state_change_swaps_label(self):
+        display = _display()
+        label = display._switcher.content
+        display.set_connecting()
+
+        assert display._switcher.content is not label
+        display.update.assert_called_once()
+
+    def test_repeated_state_change_is_skipped(self):
+        display = _display()
+        display.set_connecting()
+        label = display._switcher.content
+        display.set_connecting()
+
+        assert display._switcher.content is label
+        display.update.assert_called_once()
+
+    def test_color_change_is_applied(self):
+        display = _display()
+        display.set_step("50 ms")
+        display.set_status("50 ms")
+
+        assert display._switcher.content.color == ft.Colors.GREY_500
+
+
+class TestPreConnectionPing:
+    """Ping results get the localized prefix only when they carry a number."""
+
+    def test_numeric_latency_gets_prefix(self):
+        display = _display()
+        display.set_pre_connection_ping("120ms", is_success=True)
+
+        assert display._status_label.value.endswith(" 120ms")
+        assert display._status_label.value != "120ms"
+        assert display._status_label.color == ft.Colors.GREEN_400
+
+    def test_non_numeric_result_has_no_prefix(self):
+        display = _display()
+        display.set_pre_connection_ping("Timeout", is_success=False)
+
+        assert display._status_label.value == "Timeout"
+        assert display._status_label.color == ft.Colors.RED_400
+
+
+class TestColorOnlyChange:
+    """A state change that keeps the wording only recolors the label."""
+
+    def test_recolor_keeps_label(self):
+        display = _display()
+        display.set_step(display._status_label.value)
+        label = display._switcher.content
+
+        display.set_disconnected()
+        assert display._switcher.content is label
+        assert label.color == ft.Colors.ORANGE_400
+
+
+class TestUnmounted:
+    """State changes while the dashboard is off screen are kept, not raised."""
+
+    def test_setter_without_page_keeps_state(self):
+        display = StatusDisplay()
+        display.set_connecting()
+        display.set_step("Checking")
+
+        assert display._status_label.value == "Checking"
+        assert display._status_label.color == ft.Colors.AMBER_400
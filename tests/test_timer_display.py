@@ -0,0 +1,158 @@
+"""Tests for the TimerDisplay connection timer."""
+
+import asyncio
+import time
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+
+from src.ui.components.timer_display import TimerDisplay
+
+
+@pytest.fixture
+def timer():
+    page = MagicMock()
+    with patch.object(TimerDisplay, "page", new_callable=PropertyMock, return_value=page):
+        display = TimerDisplay()
+        display.update = MagicMock()
+        yield display, page
+
+
+class TestTimerLoop:
+    """The timer runs as a single page task that is cancelled on disconnect."""
+
+    def test_connect_schedules_task(self, timer):
+        display, page = timer
+        display.set_connected()
+        page.run_task.assert_called_once_with(display._timer_loop)
+
+    def test_disconnect_cancels_task(self, timer):
+        display, page = timer
+        display.set_connected()
+        task = page.run_task.return_value
+
+        display.set_disconnected()
+        task.cancel.assert_called_once()
+
+    def test_reconnect_replaces_previous_task(self, timer):
+        display, page = timer
+        first, second = MagicMock(), MagicMock()
+        page.run_task.side_effect = [first, second]
+
+        display.set_connected()
+        display.set_connected()
+        first.cancel.assert_called_once()
+        second.cancel.assert_not_called()
+
+    def test_loop_exits_when_update_fails(self, timer):
+        display, _ = timer
+        display.update.side_effect = RuntimeError("unmounted")
+        display._start_time = time.monotonic()
+        asyncio.run(asyncio.wait_for(display._timer_loop(), timeout=1))
+        assert display._timer_text.value == "00:00:00"
+
+    def test_loop_ticks_on_fixed_cadence(self, timer):
+        display, _ = timer
+        display._start_time = time.monotonic()
+        delays = []
+
+        async def run():
+            loop = asyncio.get_running_loop()
+            clock = [loop.time()]
+            loop.time = lambda: clock[0]
+
+            async def fake_sleep(delay):
+                delays.append(delay)
+                # Each tick costs 0.25s of work on top of the sleep
+                clock[0] += delay + 0.25
+                if len(delays) == 3:
+                    raise asyncio.CancelledError
+
+            with patch("src.ui.components.timer_display.asyncio.sleep", fake_sleep):
+                try:
+                    await display._timer_loop()
+                except asyncio.CancelledError:
+                    pass
+
+        asyncio.run(run())
+        assert delays == [1, 0.75, 0.75]
+
+    def test_repeated_second_is_not_resent(self, timer):
+        display, _ = timer
+        ticks = []
+
+        async def fake_sleep(delay):
+            ticks.append(delay)
+            if len(ticks) == 3:
+                raise asyncio.CancelledError
+
+        with (
+            patch("src.ui.components.timer_display.time.monotonic", return_value=100.0),
+            patch("src.ui.components.timer_display.asyncio.sleep", fake_sleep),
+        ):
+            display._start_time = 95.0
+            with pytest.raises(asyncio.CancelledError):
+                asyncio.run(display._timer_loop())
+
+        display.update.assert_called_once()
+        assert display._timer_text.value == "00:00:05"
+
+
+class TestFormat:
+    """Elapsed seconds render as HH:MM:SS in the current language's digits."""
+
+    def test_latin_digits(self, timer):
+        display, _ = timer
+        with patch("src.ui.components.timer_display.get_language", return_value="en"):
+            display.set_connecting()
+        assert display._format_timer(3725) == "01:02:05"
+
+    def test_persian_digits(self, timer):
+        display, _ = timer
+        with patch("src.ui.components.timer_display.get_language", return_value="fa"):
+            display.set_connecting()
+        assert display._format_timer(3725) == "۰۱:۰۲:۰۵"
+
+    def test_language_is_read_once_per_connection(self, timer):
+        display, _ = timer
+        display._start_time = time.monotonic()
+        ticks = []
+
+        async def fake_sleep(delay):
+            ticks.append(delay)
+            if len(ticks) == 3:
+                raise asyncio.CancelledError
+
+        with (
+            patch("src.ui.components.timer_display.get_language", return_value="fa") as get_language,
+            patch("src.ui.components.timer_display.asyncio.sleep", fake_sleep),
+        ):
+            display.set_connected()
+            with pytest.raises(asyncio.CancelledError):
+                asyncio.run(display._timer_loop())
+
+        get_language.assert_called_once()
+        assert display._timer_text.value == "۰۰:۰۰:۰۰"
+
+
+class TestLifecycle:
+    """The tick loop follows the control's mount state."""
+
+    def test_unmount_stops_and_remount_resumes(self, timer):
+        display, page = timer
+        display.set_connected()
+        started = display._start_time
+        first = page.run_task.return_value
+
+        display.will_unmount()
+        first.cancel.assert_called_once()
+        assert display._timer_task is None
+
+        display.did_mount()
+        assert page.run_task.call_count == 2
+        assert display._start_time == started
+
+    def test_mount_while_disconnected_does_not_tick(self, timer):
+        display, page = timer
+        display.did_mount()
+        page.run_task.assert_not_called()
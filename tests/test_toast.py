@@ -0,0 +1,85 @@
+"""Tests for ToastManager overlay handling."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.ui.components.toast import _MAX_TOASTS, Toast, ToastManager
+
+
+@pytest.fixture
+def manager():
+    page = MagicMock()
+    page.overlay = []
+    return ToastManager(page), page
+
+
+async def _no_sleep(delay):
+    pass
+
+
+class TestToastManager:
+    """Toasts are bounded on screen and fade out without a page repaint."""
+
+    def test_burst_drops_oldest(self, manager):
+        manager, page = manager
+        for i in range(_MAX_TOASTS + 2):
+            manager.show(f"message {i}")
+
+        assert len(page.overlay) == _MAX_TOASTS
+        assert page.overlay[0].content.content.controls[1].value == "message 2"
+        assert page.update.call_count == _MAX_TOASTS + 2
+
+    def test_dismiss_fades_toast_then_removes_it(self, manager):
+        manager, page = manager
+        manager.show("hello")
+        auto_dismiss = page.run_task.call_args.args[0]
+        page.update.reset_mock()
+
+        with (
+            patch.object(Toast, "update") as toast_update,
+            patch("src.ui.components.toast.asyncio.sleep", _no_sleep),
+        ):
+            asyncio.run(auto_dismiss())
+
+        toast_update.assert_called_once()
+        page.update.assert_called_once()
+        assert page.overlay == []
+
+    def test_dropped_toast_skips_dismiss(self, manager):
+        manager, page = manager
+        manager.show("first")
+        first_dismiss = page.run_task.call_args.args[0]
+        for i in range(_MAX_TOASTS):
+            manager.show(f"message {i}")
+        page.update.reset_mock()
+
+        with (
+            patch.object(Toast, "update") as toast_update,
+            patch("src.ui.components.toast.asyncio.sleep", _no_sleep),
+        ):
+            asyncio.run(first_dismiss())
+
+        toast_update.assert_not_called()
+        page.update.assert_not_called()
+        assert len(page.overlay) == _MAX_TOASTS
+
+    def test_dropped_identical_toast_leaves_others(self, manager):
+        manager, page = manager
+        manager.show("Port saved", "success")
+        first_dismiss = page.run_task.call_args.args[0]
+        for _ in range(_MAX_TOASTS):
+            manager.show("Port saved", "success")
+        on_screen = list(page.overlay)
+
+        with (
+            patch.object(Toast, "update") as toast_update,
+            patch("src.ui.components.toast.asyncio.sleep", _no_sleep),
+        ):
+            asyncio.run(first_dismiss())
+
+        toast_update.assert_not_called()
+        assert len(page.overlay) == _MAX_TOASTS
+        assert all(a is b for a, b in zip(page.overlay, on_screen))
+        assert all(a is b for a, b in zip(manager._active, on_screen))